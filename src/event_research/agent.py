@@ -6,14 +6,25 @@ before producing the final structured response.
 
 from __future__ import annotations
 
-import json
+import random
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import anthropic
+import httpx
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
+from event_research.cache import TTLCache, fingerprint
 from event_research.config import Config
 from event_research.models import EventBrief, Venue, ResearchResult
-from event_research.templates.base import SYSTEM_PROMPT, build_research_prompt
+from event_research.templates.base import (
+    SYSTEM_PROMPT,
+    build_research_brief,
+    build_research_instructions,
+)
 
 
 # Web search tool definition for Claude
@@ -24,61 +35,196 @@ WEB_SEARCH_TOOL = {
 }
 
 MAX_TURNS = 15  # Safety limit on agentic loop iterations
+CONTINUE_STOP_REASONS = {"tool_use", "pause_turn"}  # stop reasons that mean "keep searching"
+
+NOTION_LOOKUP_TIMEOUT = 10  # seconds to wait for the background Notion lookup
+RESEARCH_CACHE_TTL = 3600  # seconds an identical brief reuses a previous result
+MAX_EXISTING_NAMES_IN_PROMPT = 50  # cap on "already have these" names sent to Claude
+RETRYABLE_STATUS_CODES = {429, 503, 529}  # rate limited / unavailable / overloaded
+RETRY_BASE_DELAY = 10  # seconds — backoff window doubles each attempt
+
+# Output token budget — the final JSON is roughly a fixed overhead plus a
+# few hundred tokens per venue (21 fields each), so size max_tokens to what
+# we expect back. Which turn is the final one isn't known until it returns,
+# so every turn gets this budget; a turn that runs out of it is re-run once
+# at MAX_OUTPUT_TOKENS rather than losing the truncated JSON.
+MAX_OUTPUT_TOKENS = 8000
+BASE_OUTPUT_TOKENS = 1500
+TOKENS_PER_VENUE = 650
+
+_CITE_RE = re.compile(r"<cite[^>]*>(.*?)</cite>", re.DOTALL)
+_JSON_TOKEN_RE = re.compile(r'[{}"\\]')  # the only characters the JSON scanner cares about
+
+_VENUE_LIST_ADAPTER = TypeAdapter(list[Venue])
+
+# System prompt marked for Anthropic prompt caching — it's identical on every
+# turn of every research call, so later turns read it from cache
+_SYSTEM_BLOCKS = [
+    {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+]
+
+_research_cache = TTLCache(maxsize=512, ttl=RESEARCH_CACHE_TTL)
+
+# Background pool for the Notion lookup that runs alongside prompt setup
+_lookup_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="notion-lookup")
+
+# One pooled client per API key — reused across turns and research calls so
+# we don't pay a fresh TCP/TLS handshake on every request
+_clients: dict[str, anthropic.Anthropic] = {}
+_clients_lock = threading.Lock()
+
+
+def get_anthropic_client(api_key: str) -> anthropic.Anthropic:
+    """Return a shared Anthropic client for the given API key."""
+    client = _clients.get(api_key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(api_key)
+            if client is None:
+                client = anthropic.Anthropic(
+                    api_key=api_key,
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(
+                            max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0,
+                        ),
+                        timeout=httpx.Timeout(120.0, connect=10.0),
+                    ),
+                )
+                _clients[api_key] = client
+    return client
+
+
+def _max_tokens_for(venue_count: int) -> int:
+    """Output budget sized to the JSON we expect back, capped at MAX_OUTPUT_TOKENS."""
+    return min(MAX_OUTPUT_TOKENS, BASE_OUTPUT_TOKENS + TOKENS_PER_VENUE * venue_count)
+
+
+def _stream_message(client, model, messages, max_tokens=MAX_OUTPUT_TOKENS) -> anthropic.types.Message:
+    """Stream one agent turn and return the assembled message.
+
+    Streaming gets the first tokens back sooner than a blocking create() and
+    lets us report progress while the final JSON is being generated.
+    """
+    with client.messages.stream(
+        model=model,
+        max_tokens=max_tokens,
+        system=_SYSTEM_BLOCKS,
+        tools=[WEB_SEARCH_TOOL],
+        messages=messages,
+    ) as stream:
+        venues_seen = 0
+        tail = ""
+        for text in stream.text_stream:
+            # Each venue object in the final JSON starts with a "name" key;
+            # keep a short tail so a key split across chunks is still counted
+            window = tail + text
+            found = window.count('"name"')
+            if found:
+                venues_seen += found
+                print(f"   📝 Writing up venue {venues_seen}...", flush=True)
+            tail = window[-5:] if found == 0 else window[window.rindex('"name"') + 6:][-5:]
+        return stream.get_final_message()
+
+
+def _retry_delay(error: anthropic.APIStatusError, attempt: int) -> float:
+    """Seconds to wait before retrying — honors Retry-After, else jittered exponential backoff."""
+    retry_after = 0.0
+    try:
+        retry_after = float(error.response.headers.get("retry-after", 0))
+    except (AttributeError, TypeError, ValueError):
+        pass
+    backoff = random.uniform(1, RETRY_BASE_DELAY * 2 ** attempt)
+    return max(retry_after, backoff)
 
 
-def _call_with_retry(client, model, messages, max_retries=3):
-    """Call the API with automatic retry on rate limit errors."""
+def _call_with_retry(client, model, messages, max_tokens=MAX_OUTPUT_TOKENS, max_retries=3):
+    """Call the API with automatic retry on rate limit / overloaded errors."""
     for attempt in range(max_retries):
         try:
-            return client.messages.create(
-                model=model,
-                max_tokens=8000,
-                system=SYSTEM_PROMPT,
-                tools=[WEB_SEARCH_TOOL],
-                messages=messages,
-            )
-        except anthropic.RateLimitError:
-            wait = 30 * (attempt + 1)
-            print(f"   ⏳ Rate limited — waiting {wait}s before retry ({attempt + 1}/{max_retries})...")
+            return _stream_message(client, model, messages, max_tokens=max_tokens)
+        except anthropic.APIStatusError as e:
+            if e.status_code not in RETRYABLE_STATUS_CODES:
+                raise
+            wait = _retry_delay(e, attempt)
+            print(f"   ⏳ API busy ({e.status_code}) — waiting {wait:.0f}s before retry ({attempt + 1}/{max_retries})...")
             time.sleep(wait)
     # Final attempt without catching
-    return client.messages.create(
-        model=model,
-        max_tokens=8000,
-        system=SYSTEM_PROMPT,
-        tools=[WEB_SEARCH_TOOL],
-        messages=messages,
-    )
+    return _stream_message(client, model, messages, max_tokens=max_tokens)
 
 
-def run_research(brief: EventBrief, config: Config, skip_notion_lookup: bool = False) -> ResearchResult:
+def _brief_fingerprint(brief: EventBrief, config: Config, skip_notion_lookup: bool) -> str:
+    """Canonical cache key for a brief — list fields are order-insensitive."""
+    data = brief.model_dump(mode="json")
+    data["requirements"] = sorted(data["requirements"])
+    data["keywords"] = sorted(data["keywords"])
+    data["_model"] = config.model
+    data["_skip_notion_lookup"] = skip_notion_lookup
+    return fingerprint(data)
+
+
+def run_research(
+    brief: EventBrief,
+    config: Config,
+    skip_notion_lookup: bool = False,
+    use_cache: bool = True,
+) -> ResearchResult:
     """Run the research agent for a given event brief.
 
+    Identical briefs within RESEARCH_CACHE_TTL return the cached result.
+    Briefs with free-form notes are treated as one-off requests and always
+    re-run, as are calls with use_cache=False.
+    """
+    cache_key = None
+    if use_cache and not brief.notes:
+        cache_key = _brief_fingerprint(brief, config, skip_notion_lookup)
+        cached = _research_cache.get(cache_key)
+        if cached is not None:
+            print(f"\n♻️  Using cached research for {brief.event_type.value} venues in {brief.city}")
+            return cached.model_copy(deep=True)
+
+    result = _run_research(brief, config, skip_notion_lookup)
+
+    if cache_key and result.venues:
+        _research_cache.set(cache_key, result.model_copy(deep=True))
+    return result
+
+
+def _run_research(brief: EventBrief, config: Config, skip_notion_lookup: bool) -> ResearchResult:
+    """Run the research agent (uncached).
+
     First checks Notion for existing matching venues, then searches the web
     for additional recommendations.
     """
-    # Step 0: Check Notion for existing matches
-    existing_venues = []
+    # Step 0: Kick off the Notion lookup in the background so it overlaps
+    # with client setup and prompt building
+    lookup_future = None
     if not skip_notion_lookup and config.notion_database_id and config.notion_api_key:
+        from event_research.notion_lookup import find_matching_venues
+        lookup_future = _lookup_executor.submit(find_matching_venues, brief, config)
+
+    client = get_anthropic_client(config.anthropic_api_key)
+
+    brief_text = build_research_brief(brief)
+
+    existing_venues = []
+    if lookup_future is not None:
         try:
-            from event_research.notion_lookup import find_matching_venues
-            existing_venues = find_matching_venues(brief, config)
+            existing_venues = lookup_future.result(timeout=NOTION_LOOKUP_TIMEOUT)
             if existing_venues:
                 print(f"\n📋 Found {len(existing_venues)} existing venue(s) in Notion that match")
         except Exception as e:
-            print(f"\n⚠️  Notion lookup failed (continuing with web search): {e}")
-
-    client = anthropic.Anthropic(api_key=config.anthropic_api_key)
-
-    user_prompt = build_research_prompt(brief)
+            print(f"\n⚠️  Notion lookup failed (continuing with web search): {e!r}")
 
     # If we have existing venues, tell the agent about them so it doesn't re-research
     if existing_venues:
-        existing_names = [v.name for v in existing_venues]
-        user_prompt += (
+        existing_names = _dedupe_names(v.name for v in existing_venues)
+        names_text = ", ".join(existing_names[:MAX_EXISTING_NAMES_IN_PROMPT])
+        if len(existing_names) > MAX_EXISTING_NAMES_IN_PROMPT:
+            names_text += f" ... and {len(existing_names) - MAX_EXISTING_NAMES_IN_PROMPT} more"
+        brief_text += (
             f"\n\nNOTE: We already have these venues in our database for this area. "
             f"Do NOT include them in your results — find NEW venues instead:\n"
-            f"{', '.join(existing_names)}"
+            f"{names_text}"
         )
 
     print(f"\n🔍 Researching {brief.event_type.value} venues in {brief.city}...")
@@ -90,41 +236,56 @@ def run_research(brief: EventBrief, config: Config, skip_notion_lookup: bool = F
         print(f"   Guests: {brief.guest_count}")
     print(f"   Searching (this may take 1-2 minutes)...\n")
 
-    messages = [{"role": "user", "content": user_prompt}]
+    # The instructions are the same for every brief of this event type, so
+    # they're cached as a prefix and only the brief is new input
+    messages = [{"role": "user", "content": [
+        {
+            "type": "text",
+            "text": build_research_instructions(brief.event_type),
+            "cache_control": {"type": "ephemeral"},
+        },
+        {"type": "text", "text": brief_text},
+    ]}]
+
+    max_tokens = _max_tokens_for(config.max_venues_per_search)
 
     # Agentic loop — keep going until Claude stops using tools
     for turn in range(MAX_TURNS):
-        response = _call_with_retry(client, config.model, messages)
-
+        response = _call_with_retry(client, config.model, messages, max_tokens=max_tokens)
+        if response.stop_reason == "max_tokens" and max_tokens < MAX_OUTPUT_TOKENS:
+            print(f"   ⚠️  Turn {turn + 1}: ran out of output budget, retrying with {MAX_OUTPUT_TOKENS} tokens...")
+            max_tokens = MAX_OUTPUT_TOKENS
+            response = _call_with_retry(client, config.model, messages, max_tokens=max_tokens)
 
         # If Claude is done (no more tool use), break
         if response.stop_reason == "end_turn":
             print(f"   ✅ Research complete ({turn + 1} turn(s))")
             break
 
-        # Otherwise, Claude used tools — add its response and continue
-        # The response content includes both text and tool_use/server_tool_use blocks
-        messages.append({"role": "assistant", "content": response.content})
-
-        # Build tool results for any tool uses in the response
+        # One pass over the content: count searches and collect their results.
         # For web_search (server-side tool), results are already in the response
-        # We just need to keep the conversation going
+        # — we include them back so Claude sees its own search results.
+        search_count = 0
         tool_results = []
         for block in response.content:
-            if block.type == "web_search_tool_result":
-                # Server-side tool results are already handled by the API
-                # We include them back so Claude sees its own search results
+            if block.type == "server_tool_use":
+                search_count += 1
+            elif block.type == "web_search_tool_result":
                 tool_results.append(block)
 
+        # Only go another round if Claude is actually mid-search; anything else
+        # (max_tokens, stale results with no new searches) means we're done
+        if not search_count or response.stop_reason not in CONTINUE_STOP_REASONS:
+            print(f"   ⚠️  Turn {turn + 1}: No further searches requested, finishing...")
+            break
+
+        # Otherwise, Claude used tools — add its response and continue.
+        # The response content includes both text and tool_use/server_tool_use blocks
+        messages.append({"role": "assistant", "content": response.content})
         if tool_results:
+            # All results go in a single user message to keep strict role alternation
             messages.append({"role": "user", "content": tool_results})
-            search_count = sum(1 for b in response.content if b.type == "server_tool_use")
-            print(f"   🔎 Turn {turn + 1}: {search_count} web search(es)...")
-        else:
-            # No tool results to feed back — model may have stopped with tool_use
-            # but without server tool results. Just break.
-            print(f"   ⚠️  Turn {turn + 1}: No search results returned, finishing...")
-            break
+        print(f"   🔎 Turn {turn + 1}: {search_count} web search(es)...")
     else:
         print(f"   ⚠️  Hit max turns ({MAX_TURNS}), returning what we have...")
 
@@ -133,8 +294,10 @@ def run_research(brief: EventBrief, config: Config, skip_notion_lookup: bool = F
     # Combine existing Notion venues with new research results
     if existing_venues:
         # Put existing venues first, labeled so the user knows
-        for v in existing_venues:
-            v.highlights = f"[From existing database] {v.highlights or ''}"
+        existing_venues = [
+            v.model_copy(update={"highlights": f"[From existing database] {v.highlights or ''}"})
+            for v in existing_venues
+        ]
         result.venues = existing_venues + result.venues
         if result.research_notes:
             result.research_notes = (
@@ -146,6 +309,18 @@ def run_research(brief: EventBrief, config: Config, skip_notion_lookup: bool = F
     return result
 
 
+def _dedupe_names(names) -> list[str]:
+    """Drop blank and case-insensitive duplicate names, keeping first-seen order."""
+    seen = set()
+    unique = []
+    for name in names:
+        key = name.strip().lower() if name else ""
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(name)
+    return unique
+
+
 def _parse_response(response: anthropic.types.Message, brief: EventBrief) -> ResearchResult:
     """Parse Claude's response into structured ResearchResult."""
 
@@ -171,36 +346,28 @@ def _parse_response(response: anthropic.types.Message, brief: EventBrief) -> Res
             research_notes=f"Could not parse agent response as JSON. Raw response:\n{text_content[:3000]}",
         )
 
-    # Parse venues
-    venues = []
+    # Parse venues — apply brief-based fallbacks, then validate the whole
+    # list in one pass. Only fall back to per-venue validation if it fails.
+    raw_venues = []
     for v in data.get("venues", []):
-        try:
-            venue = Venue(
-                name=v.get("name", "Unknown"),
-                address=v.get("address", "Unknown"),
-                neighborhood=v.get("neighborhood", brief.neighborhood or "Unknown"),
-                city=v.get("city", brief.city),
-                venue_type=v.get("venue_type", "Unknown"),
-                website=v.get("website"),
-                phone=v.get("phone"),
-                email=v.get("email"),
-                contact_name=v.get("contact_name"),
-                price_range=v.get("price_range"),
-                estimated_cost=v.get("estimated_cost"),
-                capacity_min=v.get("capacity_min"),
-                capacity_max=v.get("capacity_max"),
-                private_space=v.get("private_space"),
-                av_available=v.get("av_available"),
-                outdoor_space=v.get("outdoor_space"),
-                cuisine_or_style=v.get("cuisine_or_style"),
-                best_for=v.get("best_for", [brief.event_type.value]),
-                highlights=_strip_citations(v.get("highlights", "")) or None,
-                source_url=v.get("source_url"),
-                confidence=v.get("confidence", "medium"),
-            )
-            venues.append(venue)
-        except Exception as e:
-            print(f"  ⚠️  Skipped venue due to parse error: {e}")
+        if not isinstance(v, dict):
+            continue
+        v = dict(v)
+        v.setdefault("neighborhood", brief.neighborhood or "Unknown")
+        v.setdefault("city", brief.city)
+        v.setdefault("best_for", [brief.event_type.value])
+        v["highlights"] = _strip_citations(v.get("highlights") or "") or None
+        raw_venues.append(v)
+
+    try:
+        venues = _VENUE_LIST_ADAPTER.validate_python(raw_venues)
+    except ValidationError:
+        venues = []
+        for v in raw_venues:
+            try:
+                venues.append(Venue.model_validate(v))
+            except ValidationError as e:
+                print(f"  ⚠️  Skipped venue due to parse error: {e}")
 
     return ResearchResult(
         brief=brief,
@@ -214,8 +381,8 @@ def _extract_json(text: str) -> dict | None:
 
     # Strategy 1: Direct parse
     try:
-        return json.loads(text.strip())
-    except json.JSONDecodeError:
+        return orjson.loads(text.strip())
+    except orjson.JSONDecodeError:
         pass
 
     # Strategy 2: Remove markdown code fences
@@ -224,22 +391,65 @@ def _extract_json(text: str) -> dict | None:
         lines = cleaned.split("\n")
         lines = [l for l in lines if not l.strip().startswith("```")]
         try:
-            return json.loads("\n".join(lines))
-        except json.JSONDecodeError:
+            return orjson.loads("\n".join(lines))
+        except orjson.JSONDecodeError:
             pass
 
-    # Strategy 3: Find the outermost JSON object
-    start = text.find("{")
-    end = text.rfind("}") + 1
-    if start >= 0 and end > start:
+    # Strategy 3: Scan for balanced top-level objects (handles prose before,
+    # between, or after the JSON) and return the first one that parses
+    for candidate in _iter_json_objects(text):
         try:
-            return json.loads(text[start:end])
-        except json.JSONDecodeError:
-            pass
+            data = orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            continue
+        if isinstance(data, dict):
+            return data
 
     return None
 
 
+def _iter_json_objects(text: str):
+    """Yield each balanced top-level {...} span in text, in a single pass.
+
+    Tracks brace depth and string/escape state so braces inside JSON string
+    values don't confuse the match. Quotes outside any object are ignored,
+    since they're just prose.
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped_pos = -1
+
+    for match in _JSON_TOKEN_RE.finditer(text):
+        pos = match.start()
+        ch = match.group()
+
+        if in_string:
+            if pos == escaped_pos:
+                continue
+            if ch == "\\":
+                escaped_pos = pos + 1
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == "{":
+            if depth == 0:
+                start = pos
+            depth += 1
+        elif ch == "}":
+            if depth == 0:
+                continue
+            depth -= 1
+            if depth == 0:
+                yield text[start:pos + 1]
+        elif ch == '"' and depth > 0:
+            in_string = True
+
+
 def _strip_citations(text: str) -> str:
     """Remove <cite index="...">...</cite> tags, keeping the inner text."""
-    return re.sub(r'<cite[^>]*>(.*?)</cite>', r'\1', text, flags=re.DOTALL)
+    # Most text has no citation tags — skip the regex engine entirely
+    if "<cite" not in text:
+        return text
+    return _CITE_RE.sub(r"\1", text)
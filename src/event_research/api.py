@@ -8,23 +8,42 @@ GET  /health    — health check
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hmac
 import os
+import re
 from contextlib import asynccontextmanager
 
 import anthropic
+import httpx
+import orjson
 from fastapi import FastAPI, HTTPException, Header
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
-from event_research.config import load_config
-from event_research.models import EventBrief, EventType, ResearchResult
+from event_research.cache import TTLCache, fingerprint
+from event_research.config import load_config, load_env
+from event_research.models import (
+    CITY_ALIASES, EVENT_TYPE_BY_VALUE, EnrichedVenue, EventBrief, EventDetails, ResearchResult, Venue,
+)
 from event_research.agent import run_research
-from event_research.notion_sync import push_results_to_notion
-from event_research.slack_format import format_results_for_slack
+from event_research.health_check import run_health_checks
+from event_research.notion_sync import (
+    NOTION_MAX_CONCURRENCY, push_results_to_notion, get_venues_for_outreach, get_venue_by_page_id,
+    close_notion_clients, get_notion_client, today_iso, update_venue_outreach,
+    get_linked_project_content, fetch_page_content,
+)
+from event_research.outreach_agent import run_outreach_batch
+from event_research.slack_format import format_results_for_slack, format_outreach_for_slack
 
 
 # ---- Request / Response models ----
 
+# Input size limits — oversized payloads are rejected with a 422 before any
+# Claude tokens are spent on them
+MAX_MESSAGE_CHARS = 4000
+MAX_LIST_ITEMS = 50
+
 class ResearchRequest(BaseModel):
     """Incoming research request from n8n / Slack."""
 
@@ -35,13 +54,14 @@ class ResearchRequest(BaseModel):
     guest_count: int | None = None
     vibe: str | None = None
     audience: str | None = None
-    requirements: list[str] = Field(default_factory=list)
-    keywords: list[str] = Field(default_factory=list)
+    requirements: list[str] = Field(default_factory=list, max_length=MAX_LIST_ITEMS)
+    keywords: list[str] = Field(default_factory=list, max_length=MAX_LIST_ITEMS)
     date_range: str | None = None
-    notes: str | None = None
+    notes: str | None = Field(default=None, max_length=MAX_MESSAGE_CHARS)
     push_to_notion: bool = True
     slack_format: bool = True  # return Slack Block Kit format
     new_only: bool = False  # skip Notion lookup, only return new web results
+    skip_cache: bool = False  # force a fresh run even if this brief was researched recently
 
 
 class ResearchResponse(BaseModel):
@@ -56,26 +76,90 @@ class ResearchResponse(BaseModel):
     error: str | None = None
 
 
+STREAM_VENUE_THRESHOLD = 20  # stream /research responses with at least this many venues
+
+_EVENT_TYPE_CHOICES = ", ".join(EVENT_TYPE_BY_VALUE)
+
+# Batch serializers — one Rust-side pass over the whole list
+_VENUE_LIST_ADAPTER = TypeAdapter(list[Venue])
+_ENRICHED_VENUE_LIST_ADAPTER = TypeAdapter(list[EnrichedVenue])
+_BRIEF_FIELDS = set(EventBrief.model_fields)
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Serialize a response model straight to a JSON Response.
+
+    Returning a Response skips FastAPI's jsonable_encoder / response_model
+    re-validation pass; response_model on the route is still used for docs.
+    Build models with .model_construct() since the handler already controls
+    the field values. model_dump_json writes the body in one pydantic-core
+    pass, with no intermediate dict for a second encoder to walk.
+    """
+    return Response(model.model_dump_json(), media_type="application/json")
+
+
 # ---- App ----
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Validate config on startup
     config = load_config()
-    missing = config.validate_keys()
+    missing = app.state.missing_keys = frozenset(config.validate_keys())
     if "ANTHROPIC_API_KEY" in missing:
         print("⚠️  WARNING: ANTHROPIC_API_KEY not set — research will fail")
+
+    # One AsyncAnthropic client for the life of the process (used by /parse)
+    app.state.anthropic = _get_async_client(config.anthropic_api_key)
     yield
 
+    for client in _async_clients.values():
+        await client.close()
+    _async_clients.clear()
+    close_notion_clients()
+
 
 app = FastAPI(
     title="Event Venue Research Agent",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Simple API key auth — set API_SECRET env var to require it
+# Simple API key auth — set API_SECRET env var to require it (may live in .env)
+load_env()
 API_SECRET = os.getenv("API_SECRET", "")
+_API_SECRET_BYTES = API_SECRET.encode()
+
+
+def _streaming_json_response(fields: dict, **lists) -> StreamingResponse:
+    """Stream a JSON object whose list-valued fields are encoded item by item.
+
+    Produces the same body as a regular JSON response. ``fields`` holds the
+    scalar fields; each keyword in ``lists`` is an iterable (or None).
+    """
+
+    def _chunks():
+        yield orjson.dumps(fields)[:-1]  # drop the closing brace
+        for name, items in lists.items():
+            yield b"," + orjson.dumps(name) + b":"
+            if items is None:
+                yield b"null"
+                continue
+            yield b"["
+            for i, item in enumerate(items):
+                yield (b"," if i else b"") + orjson.dumps(item)
+            yield b"]"
+        yield b"}"
+
+    return StreamingResponse(_chunks(), media_type="application/json")
+
+
+def _missing_keys(config) -> frozenset[str]:
+    """Missing config keys, computed once at startup (env vars don't change mid-process)."""
+    missing = getattr(app.state, "missing_keys", None)
+    if missing is None:
+        missing = app.state.missing_keys = frozenset(config.validate_keys())
+    return missing
 
 
 def _check_auth(authorization: str | None):
@@ -85,8 +169,9 @@ def _check_auth(authorization: str | None):
     if not authorization:
         raise HTTPException(status_code=401, detail="Missing Authorization header")
     # Accept "Bearer <token>" or just "<token>"
-    token = authorization.replace("Bearer ", "").strip()
-    if token != API_SECRET:
+    token = authorization[7:] if authorization.startswith("Bearer ") else authorization
+    # Constant-time compare so response timing doesn't leak the secret
+    if not hmac.compare_digest(token.strip().encode(), _API_SECRET_BYTES):
         raise HTTPException(status_code=403, detail="Invalid API key")
 
 
@@ -103,65 +188,95 @@ async def research(
     """Run venue research for an event brief."""
 
     _check_auth(authorization)
+    brief = _build_brief(request.model_dump(include=_BRIEF_FIELDS))
+    return await _research_impl(
+        brief, load_config(),
+        push_to_notion=request.push_to_notion,
+        slack_format=request.slack_format,
+        new_only=request.new_only,
+        use_cache=not request.skip_cache,
+    )
 
-    # Validate event type
-    try:
-        event_type = EventType(request.event_type)
-    except ValueError:
+
+def _build_brief(fields: dict) -> EventBrief:
+    """Build an EventBrief from request fields, rejecting unknown event types with a 400."""
+    event_type = EVENT_TYPE_BY_VALUE.get(fields.get("event_type"))
+    if event_type is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid event_type: '{request.event_type}'. Must be one of: dinner, happy_hour, workshop",
+            detail=f"Invalid event_type: '{fields.get('event_type')}'. Must be one of: {_EVENT_TYPE_CHOICES}",
         )
+    return EventBrief(**{**fields, "event_type": event_type})
 
-    config = load_config()
 
-    # Build the brief
-    brief = EventBrief(
-        event_type=event_type,
-        city=request.city,
-        neighborhood=request.neighborhood,
-        budget=request.budget,
-        guest_count=request.guest_count,
-        vibe=request.vibe,
-        audience=request.audience,
-        requirements=request.requirements,
-        keywords=request.keywords,
-        date_range=request.date_range,
-        notes=request.notes,
-    )
+async def _research_impl(
+    brief: EventBrief,
+    config,
+    push_to_notion: bool = True,
+    slack_format: bool = True,
+    new_only: bool = False,
+    use_cache: bool = True,
+) -> Response:
+    """Shared body of /research — callers handle auth and config loading."""
 
-    # Run research (this is synchronous and takes 30-120s)
+    # Run research (this is synchronous and takes 30-120s) — run it in a
+    # worker thread so the event loop keeps serving other requests
     try:
-        result = run_research(brief, config, skip_notion_lookup=request.new_only)
+        result = await asyncio.to_thread(
+            run_research, brief, config,
+            skip_notion_lookup=new_only,
+            use_cache=use_cache,
+        )
     except Exception as e:
-        return ResearchResponse(
+        return _json_response(ResearchResponse.model_construct(
             status="error",
             error=f"Research failed: {str(e)}",
-        )
+        ))
 
-    # Push to Notion if requested
-    notion_urls = []
-    if request.push_to_notion and result.venues:
-        missing = config.validate_keys()
+    # Push to Notion if requested — runs in a worker thread while we format
+    # the Slack blocks, since the two are independent
+    notion_task = None
+    if push_to_notion and result.venues:
+        missing = _missing_keys(config)
         if "NOTION_API_KEY" not in missing and "NOTION_DATABASE_ID" not in missing:
-            try:
-                notion_urls = push_results_to_notion(result, config)
-            except Exception as e:
-                print(f"Notion push failed: {e}")
+            notion_task = asyncio.create_task(asyncio.to_thread(push_results_to_notion, result, config))
 
     # Format for Slack if requested
     slack_blocks = None
-    if request.slack_format:
+    if slack_format:
         slack_blocks = format_results_for_slack(result)
 
-    return ResearchResponse(
+    notion_urls = []
+    if notion_task is not None:
+        try:
+            notion_urls = await notion_task
+        except Exception as e:
+            print(f"Notion push failed: {e}")
+
+    # Big results are streamed one venue / block at a time instead of being
+    # encoded into a single large buffer
+    if len(result.venues) >= STREAM_VENUE_THRESHOLD:
+        return _streaming_json_response(
+            {
+                "status": "success",
+                "venue_count": len(result.venues),
+                "research_notes": result.research_notes,
+                "notion_urls": notion_urls,
+                "error": None,
+            },
+            # Dumped lazily, one venue per chunk, as the body is sent
+            venues=(venue.model_dump(mode="json") for venue in result.venues),
+            slack_blocks=slack_blocks,
+        )
+
+    return _json_response(ResearchResponse.model_construct(
         status="success",
         venue_count=len(result.venues),
         research_notes=result.research_notes,
-        venues=[v.dict() for v in result.venues],
+        venues=_VENUE_LIST_ADAPTER.dump_python(result.venues, mode="json"),
         slack_blocks=slack_blocks,
         notion_urls=notion_urls,
-    )
+    ))
 
 
 # ---- Parse natural language into structured request (using Claude) ----
@@ -187,8 +302,127 @@ Return ONLY the JSON object, no other text.
 """
 
 
+# ---- Local fast path for simple messages ----
+# Only used when the message contains nothing beyond event type, city,
+# budget, and guest count (plus filler words) — otherwise Claude parses it
+# so details like neighborhood, vibe, and audience aren't lost.
+
+_FAST_FILLER_WORDS = {
+    "a", "an", "the", "in", "at", "for", "of", "with", "and", "to", "around",
+    "about", "under", "budget", "is", "need", "want", "find", "me", "us",
+    "please", "venue", "venues", "spot", "spots", "place", "places",
+    "ideas", "options", "some", "looking", "host", "hosting", "i", "we",
+}
+
+_FAST_EVENT_TYPES = {
+    "dinner": "dinner",
+    "happy hour": "happy_hour",
+    "happy_hour": "happy_hour",
+    "cocktail": "happy_hour",
+    "cocktails": "happy_hour",
+    "drinks": "happy_hour",
+    "workshop": "workshop",
+    "working session": "workshop",
+}
+_FAST_CITIES = CITY_ALIASES
+
+
+def _alternation(words) -> str:
+    # Longest first so "new york city" wins over "new york"
+    return "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+
+_FAST_EVENT_RE = re.compile(rf"\b({_alternation(_FAST_EVENT_TYPES)})\b", re.IGNORECASE)
+_FAST_CITY_RE = re.compile(rf"\b({_alternation(_FAST_CITIES)})\b", re.IGNORECASE)
+_FAST_BUDGET_RE = re.compile(r"\$[\d,]+(?:\.\d+)?\s*k?\b", re.IGNORECASE)
+_FAST_GUESTS_RE = re.compile(r"\b(\d+)\s*(?:guests|people|ppl|attendees|pax)\b", re.IGNORECASE)
+# Leftover numbers are dates, bare counts ("for 20"), or ranges ("25-30") —
+# never filler
+_FAST_LEFTOVER_NUMBER_RE = re.compile(r"[\d/]")
+
+
+def _fast_parse(message: str) -> dict | None:
+    """Parse a simple message with regexes. Returns None if Claude is needed."""
+    event_types = {_FAST_EVENT_TYPES[m.lower()] for m in _FAST_EVENT_RE.findall(message)}
+    cities = {_FAST_CITIES[m.lower()] for m in _FAST_CITY_RE.findall(message)}
+    if len(event_types) != 1 or len(cities) != 1:
+        return None
+
+    budget = _FAST_BUDGET_RE.search(message)
+    guests = _FAST_GUESTS_RE.search(message)
+
+    # Anything left over that isn't filler is detail only Claude can extract
+    rest = message
+    for pattern in (_FAST_EVENT_RE, _FAST_CITY_RE, _FAST_BUDGET_RE, _FAST_GUESTS_RE):
+        rest = pattern.sub(" ", rest)
+    if _FAST_LEFTOVER_NUMBER_RE.search(rest):
+        return None
+    if not set(re.findall(r"[a-z']+", rest.lower())) <= _FAST_FILLER_WORDS:
+        return None
+
+    return {
+        "event_type": event_types.pop(),
+        "city": cities.pop(),
+        "budget": budget.group().strip() if budget else None,
+        "guest_count": int(guests.group(1)) if guests else None,
+    }
+
+
+# Marked for Anthropic prompt caching — the parse prompt never changes
+_PARSE_SYSTEM_BLOCKS = [
+    {"type": "text", "text": PARSE_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+]
+
+# Exact-match cache of successful Claude parses, keyed on the normalized message
+_parse_cache = TTLCache(maxsize=1024, ttl=3600)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _parse_cache_key(message: str) -> str:
+    """Normalize case, whitespace, and trailing punctuation so trivial variants share a key."""
+    normalized = _WHITESPACE_RE.sub(" ", message).strip().rstrip(".!?").lower()
+    return fingerprint(normalized)
+
+
+_FENCE_RE = re.compile(r"^```[a-zA-Z]*\s*|\s*```$")
+
+_async_clients: dict[str, anthropic.AsyncAnthropic] = {}
+
+
+def _get_async_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Return a shared AsyncAnthropic client so connections are reused across requests."""
+    client = _async_clients.get(api_key)
+    if client is None:
+        client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=httpx.Timeout(120.0, connect=10.0),
+            ),
+        )
+        _async_clients[api_key] = client
+    return client
+
+
+class ParsedBrief(BaseModel):
+    """Shape of the JSON the parser model returns. Nulls are dropped on dump
+    so ResearchRequest falls back to its own defaults."""
+
+    event_type: str | None = None
+    city: str | None = None
+    neighborhood: str | None = None
+    budget: str | None = None
+    guest_count: int | None = None
+    vibe: str | None = None
+    audience: str | None = None
+    requirements: list[str] | None = None
+    keywords: list[str] | None = None
+    date_range: str | None = None
+    notes: str | None = None
+
+
 class ParseRequest(BaseModel):
-    message: str
+    message: str = Field(max_length=MAX_MESSAGE_CHARS)
 
 
 class ParseResponse(BaseModel):
@@ -205,25 +439,49 @@ async def parse_message(
     """Parse a natural language message into a structured research request using Claude."""
 
     _check_auth(authorization)
-    config = load_config()
+    return _json_response(await _parse_message_impl(request.message, load_config()))
 
-    try:
-        client = anthropic.Anthropic(api_key=config.anthropic_api_key)
-        response = client.messages.create(
-            model="claude-haiku-4-20250414",
-            max_tokens=1000,
-            system=PARSE_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": request.message}],
-        )
 
-        text = response.content[0].text.strip()
-        # Extract JSON
-        if text.startswith("```"):
-            lines = text.split("\n")
-            lines = [l for l in lines if not l.strip().startswith("```")]
-            text = "\n".join(lines)
+async def _parse_message_impl(message: str, config) -> ParseResponse:
+    """Shared body of /parse — callers handle auth and config loading."""
+
+    # Repeat messages (Slack retries, re-sent requests) reuse the last parse
+    cache_key = _parse_cache_key(message)
+    cached = _parse_cache.get(cache_key)
+    if cached is not None:
+        return ParseResponse(status="success", parsed=dict(cached))
+
+    # Short, simple messages can be parsed locally without a Claude round-trip
+    parsed = _fast_parse(message)
+    if parsed:
+        return ParseResponse(status="success", parsed=parsed)
 
-        parsed = json.loads(text)
+    try:
+        client = _get_async_client(config.anthropic_api_key)
+        chunks: list[str] = []
+        async with client.messages.stream(
+            model=config.parse_model,
+            max_tokens=1000,
+            system=_PARSE_SYSTEM_BLOCKS,
+            messages=[{"role": "user", "content": message}],
+        ) as stream:
+            async for chunk in stream.text_stream:
+                # A reply that doesn't open with JSON (or a fence around it) is
+                # prose — close the stream instead of waiting for it to finish
+                if not chunks and chunk.strip():
+                    if chunk.lstrip()[0] not in "{`":
+                        return ParseResponse(status="error", error="Failed to parse the message into structured data.")
+                if chunks or chunk.strip():
+                    chunks.append(chunk)
+            response = await stream.get_final_message()
+
+        cached_tokens = getattr(response.usage, "cache_read_input_tokens", None)
+        if cached_tokens:
+            print(f"/parse: {cached_tokens} prompt token(s) served from cache")
+
+        # Strip any markdown fences, then parse + validate in one pass
+        text = _FENCE_RE.sub("", "".join(chunks).strip())
+        parsed = ParsedBrief.model_validate_json(text).model_dump(exclude_none=True)
 
         # Validate required fields
         if not parsed.get("event_type") or not parsed.get("city"):
@@ -232,9 +490,10 @@ async def parse_message(
                 error="Could not determine event type or city from your message. Please include at least the type of event (dinner, happy hour, or workshop) and the city.",
             )
 
+        _parse_cache.set(cache_key, dict(parsed))
         return ParseResponse(status="success", parsed=parsed)
 
-    except json.JSONDecodeError:
+    except ValidationError:
         return ParseResponse(status="error", error="Failed to parse the message into structured data.")
     except Exception as e:
         return ParseResponse(status="error", error=f"Parse failed: {str(e)}")
@@ -242,7 +501,7 @@ async def parse_message(
 
 class MessageResearchRequest(BaseModel):
     """Send a raw natural language message — we'll parse and research in one call."""
-    message: str
+    message: str = Field(max_length=MAX_MESSAGE_CHARS)
     push_to_notion: bool = True
     slack_format: bool = True
 
@@ -258,27 +517,23 @@ async def research_from_message(
     """
 
     _check_auth(authorization)
+    config = load_config()
 
     # Step 1: Parse the message
-    parse_result = await parse_message(
-        ParseRequest(message=request.message),
-        authorization=authorization,
-    )
+    parse_result = await _parse_message_impl(request.message, config)
 
     if parse_result.status != "success" or not parse_result.parsed:
-        return ResearchResponse(
+        return _json_response(ResearchResponse.model_construct(
             status="error",
             error=parse_result.error or "Could not parse message",
-        )
+        ))
 
     # Step 2: Run research with parsed data
-    parsed = parse_result.parsed
-    parsed["push_to_notion"] = request.push_to_notion
-    parsed["slack_format"] = request.slack_format
-
-    return await research(
-        ResearchRequest(**parsed),
-        authorization=authorization,
+    brief = _build_brief({k: v for k, v in parse_result.parsed.items() if k in _BRIEF_FIELDS})
+    return await _research_impl(
+        brief, config,
+        push_to_notion=request.push_to_notion,
+        slack_format=request.slack_format,
     )
 
 
@@ -309,10 +564,9 @@ async def health_check(
     config = load_config()
 
     try:
-        from event_research.health_check import run_health_checks
-        results = run_health_checks(config, limit=request.limit)
+        results = await asyncio.to_thread(run_health_checks, config, limit=request.limit)
 
-        return HealthCheckResponse(
+        return _json_response(HealthCheckResponse.model_construct(
             status="success",
             checked=len(results),
             active=sum(1 for r in results if r.status == "active"),
@@ -327,9 +581,9 @@ async def health_check(
                 }
                 for r in results
             ],
-        )
+        ))
     except Exception as e:
-        return HealthCheckResponse(status="error", error=str(e))
+        return _json_response(HealthCheckResponse.model_construct(status="error", error=str(e)))
 
 
 # ---- Outreach endpoint ----
@@ -344,6 +598,7 @@ class OutreachRequest(BaseModel):
     status_filter: list[str] | None = None
     limit: int = 0
     enrich_only: bool = False
+    use_cache: bool = True  # reuse cached Claude responses for identical prompts
     push_to_notion: bool = True
     slack_format: bool = True
 
@@ -379,101 +634,117 @@ async def outreach(
     config = load_config()
 
     try:
-        from event_research.notion_sync import (
-            get_venues_for_outreach, get_venue_by_page_id,
-            get_notion_client, update_venue_outreach,
-            get_linked_project_content, fetch_page_content,
-        )
-        from event_research.outreach_agent import run_outreach_batch
-        from event_research.slack_format import format_outreach_for_slack
-
         # Get venues to process
         if request.page_id:
             # Single venue by page ID (for Notion trigger)
-            page = get_venue_by_page_id(config, request.page_id)
+            page = await asyncio.to_thread(get_venue_by_page_id, config, request.page_id)
             pages = [page] if page else []
         else:
-            pages = get_venues_for_outreach(
+            pages = await asyncio.to_thread(
+                get_venues_for_outreach,
                 config,
                 city=request.city,
                 venue_name=request.venue_name,
                 status_filter=request.status_filter,
+                limit=request.limit,
             )
 
-        if request.limit > 0:
-            pages = pages[:request.limit]
-
         if not pages:
-            return OutreachResponse(
+            return _json_response(OutreachResponse.model_construct(
                 status="success",
                 total_processed=0,
                 venues=[],
-            )
+            ))
 
         # Build event details from request
         event_details = None
         if request.event_type or request.budget or request.guest_count:
-            event_details = {
-                "event_type": request.event_type or "private event",
-                "budget": request.budget,
-                "guest_count": request.guest_count,
-                "date": request.date_range,
-                "vibe": request.vibe,
-                "audience": request.audience,
-            }
+            event_details = EventDetails(
+                event_type=request.event_type or "private event",
+                budget=request.budget,
+                guest_count=request.guest_count,
+                date=request.date_range,
+                vibe=request.vibe,
+                audience=request.audience,
+            ).as_dict()
 
         # Try to get project content — explicit project_url takes priority,
         # then fall back to the first venue's linked Team Project relation
         project_content = None
         if not event_details:
             if request.project_url:
-                project_content = fetch_page_content(config, request.project_url)
+                project_content = await asyncio.to_thread(fetch_page_content, config, request.project_url)
             else:
-                project_content = get_linked_project_content(config, pages[0])
+                project_content = await asyncio.to_thread(get_linked_project_content, config, pages[0])
 
-        # Run outreach
-        result = run_outreach_batch(
+        # Run outreach (synchronous, several Claude calls per venue) in a worker thread
+        result = await asyncio.to_thread(
+            run_outreach_batch,
             pages, config,
             event_details=event_details,
             enrich_only=request.enrich_only,
             project_content=project_content,
+            use_cache=request.use_cache,
         )
 
-        # Update Notion if requested
+        # Update Notion if requested — overlaps with Slack formatting below
+        notion_task = None
         if request.push_to_notion:
             notion = get_notion_client(config)
-            for venue in result.venues:
-                if venue.page_id:
-                    update_venue_outreach(notion, venue.page_id, venue)
+            notion_sem = asyncio.Semaphore(NOTION_MAX_CONCURRENCY)
+            today = today_iso()
+
+            async def _update(venue):
+                async with notion_sem:
+                    await asyncio.to_thread(update_venue_outreach, notion, venue.page_id, venue, today)
+
+            notion_task = asyncio.gather(*[
+                _update(venue) for venue in result.venues if venue.page_id
+            ])
 
         # Format for Slack if requested
         slack_blocks = None
         if request.slack_format:
             slack_blocks = format_outreach_for_slack(result)
 
-        return OutreachResponse(
+        if notion_task is not None:
+            await notion_task
+
+        return _json_response(OutreachResponse.model_construct(
             status="success",
             total_processed=result.total_processed,
             total_enriched=result.total_enriched,
             total_emails_drafted=result.total_emails_drafted,
-            venues=[v.model_dump() for v in result.venues],
+            venues=_ENRICHED_VENUE_LIST_ADAPTER.dump_python(result.venues, mode="json"),
             slack_blocks=slack_blocks,
-        )
+        ))
 
     except Exception as e:
-        return OutreachResponse(
+        return _json_response(OutreachResponse.model_construct(
             status="error",
             error=f"Outreach failed: {str(e)}",
-        )
+        ))
 
 
 def start_server(host: str = "0.0.0.0", port: int = 8000):
-    """Start the API server (used by CLI and Dockerfile)."""
+    """Start the API server (used by CLI and Dockerfile).
+
+    Uses uvloop + httptools when available (installed via uvicorn[standard]).
+    Set WEB_CONCURRENCY to run multiple worker processes — note that the
+    in-process caches are per worker.
+    """
+    import importlib.util
     import uvicorn
+
+    has_uvloop = importlib.util.find_spec("uvloop") is not None
+    has_httptools = importlib.util.find_spec("httptools") is not None
     uvicorn.run(
         "event_research.api:app",
         host=host,
         port=int(os.getenv("PORT", port)),
+        loop="uvloop" if has_uvloop else "asyncio",
+        http="httptools" if has_httptools else "h11",
+        workers=int(os.getenv("WEB_CONCURRENCY", 1)),
         reload=False,
     )
 
@@ -3,33 +3,131 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
+import os
 import sys
-
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+import textwrap
+from typing import TYPE_CHECKING
 
 from event_research.config import load_config
-from event_research.models import EventBrief, EventType, ResearchResult
-from event_research.agent import run_research
-from event_research.notion_sync import push_results_to_notion
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from event_research.models import ResearchResult
+
+# rich, the models and the agents (anthropic, notion-client, pydantic) are
+# imported inside the handlers so `--help` and usage errors stay fast
+
+# The _display_* helpers read model attributes directly — never call
+# .model_dump() / .dict() there. Serialization only happens for --json-out.
+
+
+@functools.lru_cache(maxsize=1)
+def _event_type_choices() -> tuple[str, ...]:
+    # Only the research / outreach parsers need this, and their handlers
+    # import the models anyway (bare `--help` still never imports them)
+    from event_research.models import EventType
+
+    return tuple(t.value for t in EventType)
+
+
+_CONF_COLOR = {"high": "green", "medium": "yellow", "low": "red"}
+_CHECK_MARK = {True: "✅", False: "❌"}
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    from rich.console import Console
+    return Console()
+
+
+def _kv_panel(title: str, border: str, pairs):
+    """A Panel of bold "Key: value" lines; empty values show as 'Not specified'."""
+    from rich.panel import Panel
+    return Panel(
+        "\n".join(f"[bold]{k}:[/bold] {v or 'Not specified'}" for k, v in pairs),
+        title=title,
+        border_style=border,
+    )
+
+
+def _write_json(path: str, model, list_field: str = "venues") -> None:
+    """Write a pydantic model to disk as indented JSON.
+
+    The (potentially long) ``list_field`` is serialized one item at a time
+    and written as it goes, so the whole document never sits in memory as
+    one string. It ends up as the last key in the object.
+    """
+    head = model.model_dump_json(indent=2, exclude={list_field})
+    items = getattr(model, list_field)
+    with open(path, "w") as f:
+        f.write(head[:-2])  # drop the closing "\n}"
+        f.write(f',\n  "{list_field}": [')
+        for i, item in enumerate(items):
+            f.write(",\n" if i else "\n")
+            f.write(textwrap.indent(item.model_dump_json(indent=2), "    "))
+        f.write("\n  ]\n}\n" if items else "]\n}\n")
+
+
+_USAGE = """\
+usage: event-research {serve,research,health-check,outreach} ...
+
+Event Venue Research Agent
+
+commands:
+  serve          Start the API server
+  research       Research venues for an event
+  health-check   Verify venues in Notion are still active
+  outreach       Enrich venue contacts and draft outreach emails
+
+Run `event-research <command> --help` for a command's options.
+"""
 
 
 def main():
+    # Bare invocation / top-level help: print static usage without building
+    # any parser at all
+    if len(sys.argv) == 1 or sys.argv[1:] in (["-h"], ["--help"]):
+        sys.stdout.write(_USAGE)
+        sys.exit(1 if len(sys.argv) == 1 else 0)
+
+    # Known command: build just that command's parser and dispatch straight
+    # to its handler — no subparser tree at all
+    entry = _COMMANDS.get(sys.argv[1])
+    if entry is not None:
+        help_text, build, handle = entry
+        parser = argparse.ArgumentParser(
+            prog=f"{os.path.basename(sys.argv[0])} {sys.argv[1]}",
+            description=help_text,
+        )
+        build(parser)
+        handle(parser.parse_args(sys.argv[2:]))
+        return
+
+    # Anything else (unknown command, stray flags): the full parser, so the
+    # user gets argparse's normal usage error
     parser = argparse.ArgumentParser(description="Event Venue Research Agent")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    for name, (help_text, build, _) in _COMMANDS.items():
+        build(subparsers.add_parser(name, help=help_text))
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    _COMMANDS[args.command][2](args)
 
-    # --- serve command ---
-    serve_parser = subparsers.add_parser("serve", help="Start the API server")
+
+def _build_serve_parser(serve_parser):
     serve_parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     serve_parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
 
-    # --- research command ---
-    research_parser = subparsers.add_parser("research", help="Research venues for an event")
-    research_parser.add_argument("--type", required=True, choices=["dinner", "happy_hour", "workshop"], help="Event type")
+
+def _build_research_parser(research_parser):
+    research_parser.add_argument("--type", required=True, choices=_event_type_choices(), help="Event type")
     research_parser.add_argument("--city", required=True, help="City to search in")
     research_parser.add_argument("--neighborhood", help="Specific neighborhood or area")
     research_parser.add_argument("--budget", help="Budget (e.g. '$5,000', 'under $200pp')")
@@ -43,13 +141,14 @@ def main():
     research_parser.add_argument("--no-notion", action="store_true", help="Skip pushing to Notion")
     research_parser.add_argument("--new-only", action="store_true", help="Skip Notion lookup, only return new web search results")
     research_parser.add_argument("--json-out", help="Save raw JSON results to file")
+    research_parser.add_argument("--verbose", "-v", action="store_true", help="Show a full detail panel per venue")
+
 
-    # --- health-check command ---
-    health_parser = subparsers.add_parser("health-check", help="Verify venues in Notion are still active")
+def _build_health_check_parser(health_parser):
     health_parser.add_argument("--limit", type=int, default=0, help="Max venues to check (0 = all)")
 
-    # --- outreach command ---
-    outreach_parser = subparsers.add_parser("outreach", help="Enrich venue contacts and draft outreach emails")
+
+def _build_outreach_parser(outreach_parser):
     outreach_parser.add_argument("--city", help="Filter venues by city")
     outreach_parser.add_argument("--venue", help="Filter by venue name (partial match)")
     outreach_parser.add_argument("--status", help="Filter by status (default: New + Ready for Outreach)")
@@ -58,32 +157,27 @@ def main():
     outreach_parser.add_argument("--project-url", help="Notion URL of the Team Project page (for event details)")
     outreach_parser.add_argument("--no-notion", action="store_true", help="Skip updating Notion")
     outreach_parser.add_argument("--json-out", help="Save results to JSON file")
+    outreach_parser.add_argument("--no-cache", action="store_true", help="Ignore cached Claude responses and re-run every call")
     # Event detail overrides for email drafting (used if no linked Team Project)
-    outreach_parser.add_argument("--type", choices=["dinner", "happy_hour", "workshop"], help="Event type (for email drafting)")
+    outreach_parser.add_argument("--type", choices=_event_type_choices(), help="Event type (for email drafting)")
     outreach_parser.add_argument("--budget", help="Budget (for email drafting)")
     outreach_parser.add_argument("--guests", type=int, help="Guest count (for email drafting)")
     outreach_parser.add_argument("--date", help="Target date (for email drafting)")
     outreach_parser.add_argument("--vibe", help="Vibe (for email drafting)")
     outreach_parser.add_argument("--audience", help="Audience (for email drafting)")
 
-    args = parser.parse_args()
 
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
-
-    if args.command == "serve":
-        from event_research.api import start_server
-        start_server(host=args.host, port=args.port)
-    elif args.command == "research":
-        _handle_research(args)
-    elif args.command == "health-check":
-        _handle_health_check(args)
-    elif args.command == "outreach":
-        _handle_outreach(args)
+def _handle_serve(args):
+    from event_research.api import start_server
+    start_server(host=args.host, port=args.port)
 
 
 def _handle_research(args):
+    from event_research.agent import run_research
+    from event_research.models import EVENT_TYPE_BY_VALUE, EventBrief
+    from event_research.notion_sync import push_results_to_notion
+
+    console = _console()
     config = load_config()
 
     # Validate config
@@ -98,7 +192,7 @@ def _handle_research(args):
 
     # Build the brief
     brief = EventBrief(
-        event_type=EventType(args.type),
+        event_type=EVENT_TYPE_BY_VALUE[args.type],  # argparse choices guarantee a hit
         city=args.city,
         neighborhood=args.neighborhood,
         budget=args.budget,
@@ -112,28 +206,25 @@ def _handle_research(args):
     )
 
     # Show the brief
-    console.print(Panel(
-        f"[bold]Event Type:[/bold] {brief.event_type.value}\n"
-        f"[bold]City:[/bold] {brief.city}\n"
-        f"[bold]Neighborhood:[/bold] {brief.neighborhood or 'Any'}\n"
-        f"[bold]Budget:[/bold] {brief.budget or 'Not specified'}\n"
-        f"[bold]Guests:[/bold] {brief.guest_count or 'Not specified'}\n"
-        f"[bold]Vibe:[/bold] {brief.vibe or 'Not specified'}\n"
-        f"[bold]Audience:[/bold] {brief.audience or 'Not specified'}",
-        title="📋 Event Brief",
-        border_style="blue",
-    ))
+    console.print(_kv_panel("📋 Event Brief", "blue", (
+        ("Event Type", brief.event_type.value),
+        ("City", brief.city),
+        ("Neighborhood", brief.neighborhood or "Any"),
+        ("Budget", brief.budget),
+        ("Guests", brief.guest_count),
+        ("Vibe", brief.vibe),
+        ("Audience", brief.audience),
+    )))
 
     # Run research
     result = run_research(brief, config, skip_notion_lookup=args.new_only)
 
     # Display results
-    _display_results(result)
+    _display_results(result, verbose=args.verbose)
 
     # Save JSON if requested
     if args.json_out:
-        with open(args.json_out, "w") as f:
-            json.dump(result.model_dump(), f, indent=2, default=str)
+        _write_json(args.json_out, result)
         console.print(f"\n💾 Results saved to {args.json_out}")
 
     # Push to Notion
@@ -146,8 +237,17 @@ def _handle_research(args):
         console.print("\n[yellow]No venues found. Try broadening your search criteria.[/yellow]")
 
 
-def _display_results(result: ResearchResult):
-    """Pretty-print venue results to the console."""
+def _display_results(result: ResearchResult, verbose: bool = False):
+    """Pretty-print venue results to the console.
+
+    By default all venues go into one summary table; ``verbose`` shows a
+    full detail panel per venue instead.
+    """
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _console()
 
     if result.research_notes:
         console.print(Panel(result.research_notes, title="🗒️  Research Notes", border_style="dim"))
@@ -155,44 +255,70 @@ def _display_results(result: ResearchResult):
     if not result.venues:
         return
 
+    if not verbose:
+        table = Table(title=f"Found {len(result.venues)} venue(s)", show_lines=True, title_style="bold green")
+        table.add_column("#", justify="right", style="dim")
+        table.add_column("Venue", style="bold")
+        table.add_column("Type")
+        table.add_column("Address")
+        table.add_column("Contact")
+        table.add_column("Price")
+        table.add_column("Capacity")
+        table.add_column("Why It Fits")
+        table.add_column("Confidence")
+        for i, v in enumerate(result.venues, 1):
+            table.add_row(
+                str(i),
+                f"{v.name}\n[dim]{v.website}[/dim]" if v.website else v.name,
+                v.venue_type,
+                v.address,
+                "\n".join(filter(None, (v.contact_name, v.phone, v.email))),
+                v.price_range or v.estimated_cost or "",
+                f"{v.capacity_min or '?'} – {v.capacity_max or '?'}" if v.capacity_min or v.capacity_max else "",
+                v.highlights or "",
+                f"[{_CONF_COLOR.get(v.confidence, 'red')}]{v.confidence}[/]",
+            )
+        console.print(table)
+        return
+
     console.print(f"\n[bold green]Found {len(result.venues)} venue(s):[/bold green]\n")
 
+    # Collect every venue's panel and print once, rather than one
+    # flush + terminal-size probe per venue
+    renderables = []
     for i, v in enumerate(result.venues, 1):
         table = Table(show_header=False, box=None, padding=(0, 2))
         table.add_column("Field", style="bold cyan", width=16)
         table.add_column("Value")
 
-        table.add_row("Address", v.address)
-        table.add_row("Type", v.venue_type)
-        if v.website:
-            table.add_row("Website", v.website)
-        if v.phone:
-            table.add_row("Phone", v.phone)
-        if v.email:
-            table.add_row("Email", v.email)
-        if v.contact_name:
-            table.add_row("Contact", v.contact_name)
-        if v.price_range:
-            table.add_row("Price Range", v.price_range)
-        if v.estimated_cost:
-            table.add_row("Est. Cost", v.estimated_cost)
-        if v.capacity_min or v.capacity_max:
-            cap = f"{v.capacity_min or '?'} – {v.capacity_max or '?'} guests"
-            table.add_row("Capacity", cap)
-        if v.private_space is not None:
-            table.add_row("Private Space", "✅" if v.private_space else "❌")
-        if v.av_available is not None:
-            table.add_row("AV Available", "✅" if v.av_available else "❌")
-        if v.cuisine_or_style:
-            table.add_row("Cuisine/Style", v.cuisine_or_style)
-        if v.highlights:
-            table.add_row("Why It Fits", v.highlights)
-        table.add_row("Confidence", f"[{'green' if v.confidence == 'high' else 'yellow' if v.confidence == 'medium' else 'red'}]{v.confidence}[/]")
-
-        console.print(Panel(table, title=f"[bold]{i}. {v.name}[/bold]", border_style="green"))
+        rows = (
+            ("Address", v.address),
+            ("Type", v.venue_type),
+            ("Website", v.website),
+            ("Phone", v.phone),
+            ("Email", v.email),
+            ("Contact", v.contact_name),
+            ("Price Range", v.price_range),
+            ("Est. Cost", v.estimated_cost),
+            ("Capacity", f"{v.capacity_min or '?'} – {v.capacity_max or '?'} guests"
+                if v.capacity_min or v.capacity_max else None),
+            ("Private Space", _CHECK_MARK.get(v.private_space)),
+            ("AV Available", _CHECK_MARK.get(v.av_available)),
+            ("Cuisine/Style", v.cuisine_or_style),
+            ("Why It Fits", v.highlights),
+            ("Confidence", f"[{_CONF_COLOR.get(v.confidence, 'red')}]{v.confidence}[/]"),
+        )
+        for field, value in rows:
+            if value:
+                table.add_row(field, value)
+
+        renderables.append(Panel(table, title=f"[bold]{i}. {v.name}[/bold]", border_style="green"))
+
+    console.print(Group(*renderables))
 
 
 def _handle_health_check(args):
+    console = _console()
     config = load_config()
 
     missing = config.validate_keys()
@@ -211,6 +337,7 @@ def _handle_health_check(args):
 
 
 def _handle_outreach(args):
+    console = _console()
     config = load_config()
 
     # Validate config
@@ -223,15 +350,16 @@ def _handle_outreach(args):
         sys.exit(1)
 
     from event_research.notion_sync import (
-        get_venues_for_outreach, get_notion_client, update_venue_outreach,
+        get_venues_for_outreach, get_notion_client, today_iso, update_venue_outreach,
         get_linked_project_content, fetch_page_content,
     )
+    from event_research.models import EventDetails
     from event_research.outreach_agent import run_outreach_batch
 
     # Build status filter
     status_filter = None
     if args.status:
-        status_filter = [s.strip() for s in args.status.split(",")]
+        status_filter = frozenset(s.strip() for s in args.status.split(",") if s.strip()) or None
 
     # Query Notion for matching venues
     pages = get_venues_for_outreach(
@@ -239,11 +367,9 @@ def _handle_outreach(args):
         city=args.city,
         venue_name=args.venue,
         status_filter=status_filter,
+        limit=args.limit,
     )
 
-    if args.limit > 0:
-        pages = pages[:args.limit]
-
     if not pages:
         console.print("\n[yellow]No matching venues found in Notion.[/yellow]")
         if args.city:
@@ -257,14 +383,14 @@ def _handle_outreach(args):
     # Build event details from CLI args (if provided)
     event_details = None
     if args.type or args.budget or args.guests or args.date:
-        event_details = {
-            "event_type": args.type or "private event",
-            "budget": args.budget,
-            "guest_count": args.guests,
-            "date": args.date,
-            "vibe": args.vibe,
-            "audience": args.audience,
-        }
+        event_details = EventDetails(
+            event_type=args.type or "private event",
+            budget=args.budget,
+            guest_count=args.guests,
+            date=args.date,
+            vibe=args.vibe,
+            audience=args.audience,
+        ).as_dict()
 
     # Try to get project content — CLI --project-url takes priority,
     # then fall back to the first venue's linked Team Project relation
@@ -287,6 +413,7 @@ def _handle_outreach(args):
         event_details=event_details,
         enrich_only=args.enrich_only,
         project_content=project_content,
+        use_cache=not args.no_cache,
     )
 
     # Display results
@@ -294,31 +421,37 @@ def _handle_outreach(args):
 
     # Save JSON if requested
     if args.json_out:
-        with open(args.json_out, "w") as f:
-            json.dump(result.model_dump(), f, indent=2, default=str)
+        _write_json(args.json_out, result)
         console.print(f"\n💾 Results saved to {args.json_out}")
 
     # Update Notion
     if not args.no_notion:
         console.print("\n📤 Updating Notion...")
         notion = get_notion_client(config)
+        today = today_iso()
         updated = 0
         for venue in result.venues:
             if venue.page_id:
-                update_venue_outreach(notion, venue.page_id, venue)
+                update_venue_outreach(notion, venue.page_id, venue, today)
                 updated += 1
         console.print(f"   {updated} venue(s) updated in Notion")
 
 
 def _display_outreach_results(result):
     """Pretty-print outreach results to the console."""
-    from event_research.models import OutreachResult
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _console()
 
     if not result.venues:
         return
 
     console.print(f"\n[bold green]Outreach results for {len(result.venues)} venue(s):[/bold green]\n")
 
+    # Collect everything and print once (see _display_results)
+    renderables = []
     for i, v in enumerate(result.venues, 1):
         table = Table(show_header=False, box=None, padding=(0, 2))
         table.add_column("Field", style="bold cyan", width=18)
@@ -356,20 +489,31 @@ def _display_outreach_results(result):
         if v.booking_form_url:
             table.add_row("Booking Form", v.booking_form_url)
 
-        confidence_color = {"high": "green", "medium": "yellow", "low": "red"}.get(v.enrichment_confidence, "dim")
+        confidence_color = _CONF_COLOR.get(v.enrichment_confidence, "dim")
         table.add_row("Confidence", f"[{confidence_color}]{v.enrichment_confidence}[/]")
 
         if v.enrichment_notes:
             table.add_row("Notes", v.enrichment_notes[:200])
 
-        console.print(Panel(table, title=f"[bold]{i}. {v.name}[/bold] — {v.city}", border_style="cyan"))
+        renderables.append(Panel(table, title=f"[bold]{i}. {v.name}[/bold] — {v.city}", border_style="cyan"))
 
         # Show email draft if available
         if v.email_subject and v.email_body:
             email_text = f"[bold]Subject:[/bold] {v.email_subject}\n\n{v.email_body}"
-            console.print(Panel(email_text, title="✉️  Draft Email", border_style="dim", padding=(1, 2)))
+            renderables.append(Panel(email_text, title="✉️  Draft Email", border_style="dim", padding=(1, 2)))
+
+        renderables.append("")  # spacer
+
+    console.print(Group(*renderables))
+
 
-        console.print("")  # spacer
+# command -> (help, argument builder, handler)
+_COMMANDS = {
+    "serve": ("Start the API server", _build_serve_parser, _handle_serve),
+    "research": ("Research venues for an event", _build_research_parser, _handle_research),
+    "health-check": ("Verify venues in Notion are still active", _build_health_check_parser, _handle_health_check),
+    "outreach": ("Enrich venue contacts and draft outreach emails", _build_outreach_parser, _handle_outreach),
+}
 
 
 if __name__ == "__main__":
@@ -2,15 +2,35 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from dotenv import dotenv_values
+from pydantic import BaseModel, Field, PrivateAttr
 
-# Load .env — check current working directory, then project root
-# override=True ensures env vars get set even if already partially loaded
-load_dotenv(Path.cwd() / ".env", override=True)
-load_dotenv(Path(__file__).parent.parent.parent / ".env", override=True)
+# Fast model for parsing, extraction, drafting and first-pass enrichment
+HAIKU_MODEL = "claude-3-5-haiku-latest"
+
+
+@functools.lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load .env once per process — check current working directory, then project root.
+
+    Deferred until config is actually needed so `--help` does no file I/O.
+    Each file is read once (once total when cwd is the project root) and the
+    merged values are written to os.environ in a single pass. As before,
+    .env values override variables that are already set, and the project
+    root file wins over the cwd one.
+    """
+    merged: dict[str, str] = {}
+    paths = dict.fromkeys((
+        (Path.cwd() / ".env").resolve(),
+        (Path(__file__).parent.parent.parent / ".env").resolve(),
+    ))
+    for path in paths:
+        if path.is_file():
+            merged.update((k, v) for k, v in dotenv_values(path).items() if v is not None)
+    os.environ.update(merged)
 
 
 class Config(BaseModel):
@@ -20,19 +40,40 @@ class Config(BaseModel):
     notion_api_key: str = Field(default_factory=lambda: os.getenv("NOTION_API_KEY", ""))
     notion_database_id: str = Field(default_factory=lambda: os.getenv("NOTION_DATABASE_ID", ""))
     model: str = Field(default_factory=lambda: os.getenv("MODEL", "claude-sonnet-4-20250514"))
+    parse_model: str = Field(default_factory=lambda: os.getenv("PARSE_MODEL", HAIKU_MODEL))
     max_venues_per_search: int = 8
+    # Contact enrichment runs on a fast model; low-confidence results are
+    # re-run on escalate_model (set ESCALATE_MODEL="" to disable)
+    enrichment_model: str = Field(default_factory=lambda: os.getenv("ENRICHMENT_MODEL", HAIKU_MODEL))
+    escalate_model: str = Field(
+        default_factory=lambda: os.getenv("ESCALATE_MODEL", os.getenv("MODEL", "claude-sonnet-4-20250514"))
+    )
+    # Upper bound on Claude round-trips per venue during contact enrichment
+    max_enrichment_turns: int = Field(default_factory=lambda: int(os.getenv("MAX_ENRICHMENT_TURNS", "8")))
+    # Venues checked within this many days are skipped by the health check (0 = always check)
+    health_check_ttl_days: int = Field(default_factory=lambda: int(os.getenv("HEALTH_CHECK_TTL_DAYS", "7")))
+
+    _missing: tuple[str, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context) -> None:
+        # Keys are fixed once loaded, so work out what's missing up front
+        self._missing = tuple(
+            key for key, value in (
+                ("ANTHROPIC_API_KEY", self.anthropic_api_key),
+                ("NOTION_API_KEY", self.notion_api_key),
+                ("NOTION_DATABASE_ID", self.notion_database_id),
+            ) if not value
+        )
 
     def validate_keys(self) -> list[str]:
         """Return list of missing required keys."""
-        missing = []
-        if not self.anthropic_api_key:
-            missing.append("ANTHROPIC_API_KEY")
-        if not self.notion_api_key:
-            missing.append("NOTION_API_KEY")
-        if not self.notion_database_id:
-            missing.append("NOTION_DATABASE_ID")
-        return missing
+        return list(self._missing)
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Config:
+    """Return the process-wide Config — env vars don't change after startup."""
+    load_env()
+    # Built once per process, so the validator pass costs nothing noticeable
+    # and the int fields are checked like any other
     return Config()
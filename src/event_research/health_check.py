@@ -8,13 +8,25 @@ from __future__ import annotations
 
 import json
 import re
-import time
+import threading
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from datetime import date
+from itertools import islice
 
 import anthropic
 
+from event_research.agent import CONTINUE_STOP_REASONS, get_anthropic_client
 from event_research.config import Config
-from event_research.notion_sync import get_all_venues, get_notion_client, archive_venue, update_date_last_checked
+from event_research.models import VenueStatus
+from event_research.ratelimit import RateLimiter
+from event_research.notion_sync import (
+    NOTION_MAX_CONCURRENCY,
+    PageUpdater,
+    get_notion_client,
+    iter_all_venues,
+)
 
 
 @dataclass
@@ -36,11 +48,172 @@ WEB_SEARCH_TOOL = {
     "max_uses": 5,
 }
 
+HEALTH_CHECK_CONCURRENCY = 4  # batches checked at once
+HEALTH_CHECK_BATCH_SIZE = 5  # venues packed into one Claude request
+HEALTH_CHECK_MAX_TOKENS = 2000
+MAX_HEALTH_CHECK_TURNS = 6  # initial call + up to 5 follow-up search rounds
+
+# Client-side pacing shared by all health-check threads — paces requests
+# proactively instead of a fixed sleep between venues
+HEALTH_CHECK_RPM = 50
+HEALTH_CHECK_TPM = 80_000
+_rate_limiter = RateLimiter(rpm=HEALTH_CHECK_RPM, tpm=HEALTH_CHECK_TPM)
+
+_CITE_RE = re.compile(r"<cite[^>]*>(.*?)</cite>", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
 HEALTH_CHECK_SYSTEM = """\
 You are a venue verification agent. Your job is to check if a venue is still \
 open and active by searching the web. Be thorough but concise.
 """
 
+# Marked for Anthropic prompt caching — the system prompt (and the tool
+# schema ahead of it) is identical on every turn of every check
+_HEALTH_SYSTEM_BLOCKS = [
+    {"type": "text", "text": HEALTH_CHECK_SYSTEM, "cache_control": {"type": "ephemeral"}},
+]
+
+# Prompt tokens served from cache during the current run, reported in the summary
+_cached_tokens = 0
+_cached_tokens_lock = threading.Lock()
+
+
+# Shared prompt pieces for single and batched checks
+_CHECK_QUESTIONS = (
+    "1. Is it still open/active? (check for permanent closure notices, "
+    "Google Maps status, recent reviews, social media activity)\n"
+    "2. Has any key info changed? (new phone, new website, new address)\n\n"
+)
+_RESULT_FIELDS = (
+    '  "status": "active" or "closed" or "uncertain",\n'
+    '  "details": "Brief explanation of what you found",\n'
+    '  "updated_info": {\n'
+    '    "phone": "new phone if changed",\n'
+    '    "website": "new website if changed",\n'
+    '    "email": "new email if found"\n'
+    "  }\n"
+    "}\n\n"
+)
+_RESULT_SHAPE = "{\n" + _RESULT_FIELDS
+# Batched results echo their venue's number, so they're matched by that
+# rather than by position in the array
+_BATCH_RESULT_SHAPE = '{\n  "venue": the venue\'s number from the list (1, 2, ...),\n' + _RESULT_FIELDS
+_UPDATED_INFO_NOTE = (
+    "Only include fields in updated_info if you found NEW or CORRECTED information. "
+    "If nothing changed, set updated_info to null.\n"
+)
+
+# Static instructions go in their own cacheable block ahead of the venue
+# details, so only the venue lines are new input on each check
+_SINGLE_INSTRUCTIONS = (
+    "Check if the venue below is still open and active.\n\n"
+    "Search for this venue and determine:\n"
+    + _CHECK_QUESTIONS
+    + "Return a JSON object:\n"
+    + _RESULT_SHAPE
+    + _UPDATED_INFO_NOTE
+    + "Return ONLY the JSON object."
+)
+_BATCH_INSTRUCTIONS = (
+    "Check whether each of the venues below is still open and active.\n\n"
+    "Search for each venue and determine:\n"
+    + _CHECK_QUESTIONS
+    + "Return a JSON array with exactly one object per venue, each shaped like:\n"
+    + _BATCH_RESULT_SHAPE
+    + _UPDATED_INFO_NOTE
+    + "Return ONLY the JSON array."
+)
+
+
+def _create_message(
+    client, config: Config, messages: list,
+    max_tokens: int = HEALTH_CHECK_MAX_TOKENS, tools: list | None = None, max_retries: int = 3,
+):
+    """messages.create gated by the shared rate limiter; 429s back the limiter off and retry."""
+    # Rough cost: ~4 chars per input token plus the full output budget
+    estimate = sum(len(str(m["content"])) for m in messages) // 4 + max_tokens
+    for attempt in range(max_retries + 1):
+        _rate_limiter.acquire(estimate)
+        try:
+            return client.messages.create(
+                model=config.model,
+                max_tokens=max_tokens,
+                system=_HEALTH_SYSTEM_BLOCKS,
+                tools=tools or [WEB_SEARCH_TOOL],
+                messages=messages,
+            )
+        except anthropic.RateLimitError:
+            _rate_limiter.backoff()
+            if attempt == max_retries:
+                raise
+
+
+def _run_search_loop(
+    config: Config, instructions: str, venue_text: str,
+    max_tokens: int = HEALTH_CHECK_MAX_TOKENS, tools: list | None = None,
+) -> str:
+    """Run the web-search agentic loop for a prompt and return Claude's final text."""
+    global _cached_tokens
+    client = get_anthropic_client(config.anthropic_api_key)
+
+    # One iteration per model round-trip, stopping as soon as Claude isn't mid-search
+    messages = [{"role": "user", "content": [
+        {"type": "text", "text": instructions, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": venue_text},
+    ]}]
+    for _ in range(MAX_HEALTH_CHECK_TURNS):
+        response = _create_message(client, config, messages, max_tokens=max_tokens, tools=tools)
+        cached = getattr(response.usage, "cache_read_input_tokens", None)
+        if cached:
+            with _cached_tokens_lock:
+                _cached_tokens += cached
+        if response.stop_reason not in CONTINUE_STOP_REASONS:
+            break
+        tool_results = [b for b in response.content if b.type == "web_search_tool_result"]
+        if not tool_results:
+            break
+        messages.append({"role": "assistant", "content": response.content})
+        messages.append({"role": "user", "content": tool_results})
+
+    # Extract text
+    return "".join(block.text for block in response.content if block.type == "text")
+
+
+def _is_check_json(value) -> bool:
+    """A result object, or a non-empty array of them."""
+    if isinstance(value, list):
+        return bool(value) and all(isinstance(item, dict) for item in value)
+    return isinstance(value, dict)
+
+
+def _first_json(text: str, open_char: str) -> dict | list | None:
+    """The first result object / array in ``text`` that starts at an ``open_char``.
+
+    Each candidate is decoded only as far as its own closing bracket, so a
+    code fence, preamble or bracketed aside around the JSON doesn't break
+    the parse. Citations are stripped first.
+    """
+    # Cheap substring check first — most responses have no citations
+    if "<cite" in text:
+        text = _CITE_RE.sub(r"\1", text)
+    start = text.find(open_char)
+    while start >= 0:
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, start)
+        except ValueError:
+            value = None
+        if _is_check_json(value):
+            return value
+        start = text.find(open_char, start + 1)
+    return None
+
+
+def _venue_lines(venue_name: str, address: str, city: str, website: str | None) -> str:
+    lines = f"Name: {venue_name}\nAddress: {address}\nCity: {city}\n"
+    if website:
+        lines += f"Website: {website}\n"
+    return lines
+
 
 def check_venue_health(
     venue_name: str,
@@ -56,118 +229,232 @@ def check_venue_health(
       - details: explanation
       - updated_info: dict of any corrected/new info found
     """
-    client = anthropic.Anthropic(api_key=config.anthropic_api_key)
-
-    prompt = (
-        f"Check if this venue is still open and active:\n\n"
-        f"Name: {venue_name}\n"
-        f"Address: {address}\n"
-        f"City: {city}\n"
-    )
-    if website:
-        prompt += f"Website: {website}\n"
-
-    prompt += (
-        "\nSearch for this venue and determine:\n"
-        "1. Is it still open/active? (check for permanent closure notices, "
-        "Google Maps status, recent reviews, social media activity)\n"
-        "2. Has any key info changed? (new phone, new website, new address)\n\n"
-        "Return a JSON object:\n"
-        "{\n"
-        '  "status": "active" or "closed" or "uncertain",\n'
-        '  "details": "Brief explanation of what you found",\n'
-        '  "updated_info": {\n'
-        '    "phone": "new phone if changed",\n'
-        '    "website": "new website if changed",\n'
-        '    "email": "new email if found"\n'
-        "  }\n"
-        "}\n\n"
-        "Only include fields in updated_info if you found NEW or CORRECTED information. "
-        "If nothing changed, set updated_info to null.\n"
-        "Return ONLY the JSON object."
-    )
+    try:
+        text = _run_search_loop(config, _SINGLE_INSTRUCTIONS, _venue_lines(venue_name, address, city, website))
+
+        # Parse JSON
+        check = _first_json(text, "{")
+        if check is not None:
+            return check
+
+        return {"status": "uncertain", "details": f"Could not parse response: {text.strip()[:200]}"}
+
+    except Exception as e:
+        return {"status": "error", "details": f"Health check failed: {str(e)}"}
+
+
+def check_venues_health_batch(
+    venues: list[tuple[str, str, str, str | None]],
+    config: Config,
+) -> list[dict]:
+    """Check several venues in one request; returns one result dict per venue, in order.
+
+    ``venues`` holds (name, address, city, website) tuples. The system
+    prompt and instructions are sent once for the whole batch, and the
+    search budget scales with its size. Results are matched to venues by
+    the number each one echoes; any venue without exactly one matching
+    result is re-checked on its own. An API failure marks the whole batch
+    as errored rather than re-sending each venue into the same failure.
+    """
+    if len(venues) == 1:
+        return [check_venue_health(*venues[0], config)]
+
+    n = len(venues)
+    venue_text = f"{n} venues:\n"
+    for i, venue in enumerate(venues, 1):
+        venue_text += f"\nVenue {i}:\n" + _venue_lines(*venue)
+    tools = [{**WEB_SEARCH_TOOL, "max_uses": WEB_SEARCH_TOOL["max_uses"] * n}]
 
     try:
-        response = client.messages.create(
-            model=config.model,
-            max_tokens=2000,
-            system=HEALTH_CHECK_SYSTEM,
-            tools=[WEB_SEARCH_TOOL],
-            messages=[{"role": "user", "content": prompt}],
-        )
+        text = _run_search_loop(config, _BATCH_INSTRUCTIONS, venue_text, max_tokens=HEALTH_CHECK_MAX_TOKENS * n, tools=tools)
+    except anthropic.APIError as e:
+        return [{"status": "error", "details": f"Health check failed: {str(e)}"} for _ in venues]
 
-        # Handle agentic loop for web search
-        messages = [{"role": "user", "content": prompt}]
-        for _ in range(5):
-            if response.stop_reason == "end_turn":
-                break
-            messages.append({"role": "assistant", "content": response.content})
-            tool_results = [b for b in response.content if b.type == "web_search_tool_result"]
-            if tool_results:
-                messages.append({"role": "user", "content": tool_results})
-                response = client.messages.create(
-                    model=config.model,
-                    max_tokens=2000,
-                    system=HEALTH_CHECK_SYSTEM,
-                    tools=[WEB_SEARCH_TOOL],
-                    messages=messages,
-                )
-            else:
-                break
+    by_number: dict[int, list[dict]] = {}
+    for check in _first_json(text, "[") or []:
+        number = check.get("venue") if isinstance(check, dict) else None
+        if isinstance(number, int) and not isinstance(number, bool):
+            by_number.setdefault(number, []).append(check)
+
+    results = []
+    for i, venue in enumerate(venues, 1):
+        matched = by_number.get(i, [])
+        # A missing or duplicated number means the answers can't be trusted
+        # to belong to this venue — a wrong "closed" would archive it
+        results.append(matched[0] if len(matched) == 1 else check_venue_health(*venue, config))
+    return results
 
-        # Extract text
-        text = ""
-        for block in response.content:
-            if block.type == "text":
-                text += block.text
 
-        # Strip citations
-        text = re.sub(r'<cite[^>]*>(.*?)</cite>', r'\1', text, flags=re.DOTALL)
+def _first_plain_text(items: list) -> str:
+    return items[0].get("plain_text", "") if items else ""
 
-        # Parse JSON
-        text = text.strip()
-        if text.startswith("```"):
-            lines = text.split("\n")
-            lines = [l for l in lines if not l.strip().startswith("```")]
-            text = "\n".join(lines)
 
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start >= 0 and end > start:
-            return json.loads(text[start:end])
+# Notion property type -> plain Python value
+_PROPERTY_VALUE = {
+    "title": lambda prop: _first_plain_text(prop.get("title", [])),
+    "rich_text": lambda prop: _first_plain_text(prop.get("rich_text", [])),
+    "select": lambda prop: (prop.get("select") or {}).get("name", ""),
+    "url": lambda prop: prop.get("url", "") or "",
+    "phone_number": lambda prop: prop.get("phone_number", "") or "",
+    "email": lambda prop: prop.get("email", "") or "",
+    "number": lambda prop: prop.get("number"),
+    "checkbox": lambda prop: prop.get("checkbox"),
+    "multi_select": lambda prop: [opt.get("name", "") for opt in prop.get("multi_select", [])],
+    "date": lambda prop: (prop.get("date") or {}).get("start"),
+}
 
-        return {"status": "uncertain", "details": f"Could not parse response: {text[:200]}"}
 
-    except Exception as e:
-        return {"status": "error", "details": f"Health check failed: {str(e)}"}
+def _flatten_properties(page: dict) -> dict:
+    """All of a page's properties as {name: value} in one pass.
+
+    Property types we don't read are left out, so ``.get(name)`` is None
+    for them just like for missing properties.
+    """
+    flat = {}
+    for name, prop in page.get("properties", {}).items():
+        extract = _PROPERTY_VALUE.get(prop.get("type", ""))
+        if extract is not None:
+            flat[name] = extract(prop)
+    return flat
+
+
+# The subset of _PROPERTY_VALUE whose values are strings
+_PROPERTY_TEXT = {
+    prop_type: _PROPERTY_VALUE[prop_type]
+    for prop_type in ("title", "rich_text", "select", "url", "phone_number", "email")
+}
+
+
+def _property_text(props: dict, prop_name: str) -> str:
+    prop = props.get(prop_name)
+    if not prop:
+        return ""
+    extract = _PROPERTY_TEXT.get(prop.get("type", ""))
+    return extract(prop) if extract is not None else ""
 
 
 def _extract_property_text(page: dict, prop_name: str) -> str:
     """Extract text value from a Notion page property."""
-    prop = page.get("properties", {}).get(prop_name, {})
-    prop_type = prop.get("type", "")
-
-    if prop_type == "title":
-        items = prop.get("title", [])
-        return items[0].get("plain_text", "") if items else ""
-    elif prop_type == "rich_text":
-        items = prop.get("rich_text", [])
-        return items[0].get("plain_text", "") if items else ""
-    elif prop_type == "select":
-        sel = prop.get("select")
-        return sel.get("name", "") if sel else ""
-    elif prop_type == "url":
-        return prop.get("url", "") or ""
-    elif prop_type == "phone_number":
-        return prop.get("phone_number", "") or ""
-    elif prop_type == "email":
-        return prop.get("email", "") or ""
-    return ""
+    return _property_text(page.get("properties", {}), prop_name)
+
+
+def _extract_property_texts(page: dict, prop_names: tuple[str, ...]) -> tuple[str, ...]:
+    """Text values of several properties at once, in ``prop_names`` order."""
+    props = page.get("properties", {})
+    return tuple(_property_text(props, name) for name in prop_names)
+
+
+def _checked_recently(page: dict, ttl_days: int, today: date) -> bool:
+    """True if the page's Date Last Checked is less than ``ttl_days`` old."""
+    if ttl_days <= 0:
+        return False
+    prop = page.get("properties", {}).get("Date Last Checked", {})
+    start = _PROPERTY_VALUE["date"](prop) if prop.get("type") == "date" else None
+    if not start:
+        return False
+    try:
+        last_checked = date.fromisoformat(start[:10])
+    except ValueError:
+        return False
+    return (today - last_checked).days < ttl_days
+
+
+def iter_health_checks(config: Config, limit: int = 0) -> Iterator[HealthCheckResult]:
+    """Check non-archived venues in Notion, yielding each result as it completes.
+
+    Venues whose Date Last Checked is within config.health_check_ttl_days
+    are skipped. The rest are checked in batches of HEALTH_CHECK_BATCH_SIZE
+    per request, with up to HEALTH_CHECK_CONCURRENCY batches in flight —
+    the next batch is only read from Notion when one finishes. Each result
+    is handed to a background pool of NOTION_MAX_CONCURRENCY writers
+    (archive / date stamp / info update) before it's yielded, so consumers
+    see results — and closures are acted on — as soon as each batch
+    finishes. Nothing is retained here once yielded. A write that raises
+    is re-raised here once it's done.
+
+    Args:
+        config: App config
+        limit: Max venues to check (0 = all)
+    """
+    global _cached_tokens
+    notion = get_notion_client(config)
+    with _cached_tokens_lock:
+        _cached_tokens = 0
+
+    # Pages are submitted as each Notion result page arrives, so the first
+    # checks are already running while the rest of the database is fetched
+    today = date.today()
+    today_stamp = today.isoformat()
+    skipped = 0
+
+    def due_pages():
+        nonlocal skipped
+        for page in iter_all_venues(config):
+            if _checked_recently(page, config.health_check_ttl_days, today):
+                skipped += 1
+            else:
+                yield page
+
+    pages = due_pages()
+    if limit > 0:
+        pages = islice(pages, limit)
+
+    # Notion writes go to their own small pool so they neither hold up the
+    # loop below nor exceed Notion's per-integration concurrency
+    with ThreadPoolExecutor(max_workers=HEALTH_CHECK_CONCURRENCY, thread_name_prefix="health-check") as pool, \
+            ThreadPoolExecutor(max_workers=NOTION_MAX_CONCURRENCY, thread_name_prefix="health-write") as writer:
+        checks = set()
+        writes = set()
+
+        def submit_batch() -> None:
+            batch = list(islice(pages, HEALTH_CHECK_BATCH_SIZE))
+            if batch:
+                checks.add(pool.submit(_check_pages, batch, config))
+
+        print(f"\n🏥 Running health checks...\n")
+        for _ in range(HEALTH_CHECK_CONCURRENCY):
+            submit_batch()
+
+        done = 0
+        while checks:
+            finished, checks = wait(checks, return_when=FIRST_COMPLETED)
+            for future in finished:
+                submit_batch()  # keep the window full
+                for result in future.result():
+                    done += 1
+                    status = result.status
+                    if status == "closed":
+                        label = "❌ CLOSED — archiving"
+                    elif status == "active":
+                        label = "✅ Active"
+                    else:
+                        label = f"❓ {status}"
+                    print(f"  [{done}] '{result.venue_name}' — {label}")
+                    writes.add(writer.submit(_write_result, notion, result, today_stamp))
+                    yield result
+            writes = _raise_write_errors(writes)
+
+        wait(writes)
+        _raise_write_errors(writes)
+
+    if skipped:
+        print(f"\n   ⏭️  Skipped {skipped} venue(s) checked in the last {config.health_check_ttl_days} day(s)")
+
+
+def _raise_write_errors(writes: set) -> set:
+    """Re-raise the first failed write among the finished ones; return those still running."""
+    for future in [f for f in writes if f.done()]:
+        future.result()
+        writes.discard(future)
+    return writes
 
 
 def run_health_checks(config: Config, limit: int = 0) -> list[HealthCheckResult]:
     """Run health checks on all non-archived venues in Notion.
 
+    Consumes iter_health_checks and prints a summary once every result
+    (and its Notion write) is done.
+
     Args:
         config: App config
         limit: Max venues to check (0 = all)
@@ -175,75 +462,82 @@ def run_health_checks(config: Config, limit: int = 0) -> list[HealthCheckResult]
     Returns:
         List of HealthCheckResult for each venue checked.
     """
-    notion = get_notion_client(config)
-    pages = get_all_venues(config)
-
-    if limit > 0:
-        pages = pages[:limit]
-
     results = []
-    total = len(pages)
-
-    print(f"\n🏥 Running health checks on {total} venue(s)...\n")
+    counts = {"active": 0, "closed": 0, "uncertain": 0}
+    for result in iter_health_checks(config, limit=limit):
+        results.append(result)
+        if result.status in ("active", "closed"):
+            counts[result.status] += 1
+        elif result.status in ("uncertain", "error"):
+            counts["uncertain"] += 1
 
-    for i, page in enumerate(pages, 1):
-        name = _extract_property_text(page, "Name")
-        address = _extract_property_text(page, "Address")
-        city = _extract_property_text(page, "City")
-        website = _extract_property_text(page, "Website")
-        page_id = page["id"]
+    # Summary
+    print(f"\n📊 Health Check Summary:")
+    print(f"   ✅ Active: {counts['active']}")
+    print(f"   ❌ Closed/Archived: {counts['closed']}")
+    print(f"   ❓ Uncertain: {counts['uncertain']}")
+    if _cached_tokens:
+        print(f"   ♻️  Prompt tokens served from cache: {_cached_tokens}")
 
-        print(f"  [{i}/{total}] Checking '{name}'...", end=" ", flush=True)
+    return results
 
-        check = check_venue_health(name, address, city, website, config)
-        status = check.get("status", "uncertain")
-        details = check.get("details", "")
-        updated_info = check.get("updated_info")
 
-        result = HealthCheckResult(
-            page_id=page_id,
+def _check_pages(pages: list[dict], config: Config) -> list[HealthCheckResult]:
+    """Run the web-search health check for a batch of Notion venue pages."""
+    venues = []
+    for page in pages:
+        props = _flatten_properties(page)
+        venues.append((
+            props.get("Name") or "",
+            props.get("Address") or "",
+            props.get("City") or "",
+            props.get("Website") or "",
+        ))
+
+    checks = check_venues_health_batch(venues, config)
+    return [
+        HealthCheckResult(
+            page_id=page["id"],
             venue_name=name,
             city=city,
-            status=status,
-            details=details,
-            updated_info=updated_info,
+            status=check.get("status", "uncertain"),
+            details=check.get("details", ""),
+            updated_info=check.get("updated_info"),
         )
-        results.append(result)
+        for page, (name, _, city, _), check in zip(pages, venues, checks)
+    ]
 
-        # Update Date Last Checked for every venue we check
-        update_date_last_checked(notion, page_id)
-
-        # Take action based on status
-        if status == "closed":
-            print("❌ CLOSED — archiving")
-            archive_venue(notion, page_id)
-        elif status == "active":
-            print("✅ Active")
-            # Update any corrected info
-            if updated_info:
-                _update_venue_info(notion, page_id, updated_info)
-        else:
-            print(f"❓ {status}")
-
-        # Rate limit courtesy — wait between checks
-        if i < total:
-            time.sleep(2)
 
-    # Summary
-    active = sum(1 for r in results if r.status == "active")
-    closed = sum(1 for r in results if r.status == "closed")
-    uncertain = sum(1 for r in results if r.status in ("uncertain", "error"))
+def _write_result(notion, result: HealthCheckResult, today: str | None = None) -> None:
+    """Apply one health-check result to Notion in a single write.
 
-    print(f"\n📊 Health Check Summary:")
-    print(f"   ✅ Active: {active}")
-    print(f"   ❌ Closed/Archived: {closed}")
-    print(f"   ❓ Uncertain: {uncertain}")
+    Conclusive checks (active or closed) get their Date Last Checked
+    stamped, together with the archive or any corrected info. Uncertain and
+    failed checks are left unstamped so the next run retries them.
+    """
+    page = PageUpdater(notion, result.page_id)
+    if result.status in ("active", "closed"):
+        page.stamp_last_checked(today)
+
+    updated = []
+    if result.status == "closed":
+        page.set_status(VenueStatus.ARCHIVED)
+    elif result.status == "active" and result.updated_info:
+        for name, value in _venue_info_properties(result.updated_info).items():
+            page.set(name, value)
+            updated.append(name)
 
-    return results
+    try:
+        page.flush()
+    except Exception as e:
+        print(f"      ⚠️  Failed to update '{result.venue_name}': {e}")
+        return
+    if updated:
+        print(f"      📝 Updated '{result.venue_name}': {', '.join(updated)}")
 
 
-def _update_venue_info(notion, page_id: str, updated_info: dict) -> None:
-    """Update a venue's Notion page with corrected info from health check."""
+def _venue_info_properties(updated_info: dict) -> dict:
+    """Notion properties for the corrected info a health check found."""
     properties = {}
 
     if updated_info.get("phone"):
@@ -253,9 +547,4 @@ def _update_venue_info(notion, page_id: str, updated_info: dict) -> None:
     if updated_info.get("email"):
         properties["Email"] = {"email": updated_info["email"]}
 
-    if properties:
-        try:
-            notion.pages.update(page_id=page_id, properties=properties)
-            print(f"      📝 Updated: {', '.join(properties.keys())}")
-        except Exception as e:
-            print(f"      ⚠️  Failed to update: {e}")
+    return properties
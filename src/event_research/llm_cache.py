@@ -0,0 +1,69 @@
+"""On-disk cache for Claude responses whose inputs are byte-identical.
+
+Entries are content-addressed: ``cache_key(model, prompt_version, ...)``
+hashes every input that shapes the response, so a changed prompt or model
+simply misses. Values are stored one JSON file per key under
+``LLM_CACHE_DIR`` (default ``data/llm_cache``) as
+``{key[:2]}/{key}.json``, which survives restarts — a re-run of outreach
+over the same venues costs a file read instead of a web-search loop.
+
+The cache is best-effort: unreadable, corrupt or expired files count as a
+miss, and a failed write is ignored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+DEFAULT_CACHE_DIR = "data/llm_cache"
+DEFAULT_TTL = 7 * 24 * 3600  # seconds
+
+
+def cache_key(*parts: str) -> str:
+    """SHA-256 over the parts, each prefixed with its 8-byte length.
+
+    Length-prefixing keeps ("ab", "c") and ("a", "bc") from colliding.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        raw = part.encode()
+        digest.update(len(raw).to_bytes(8, "big"))
+        digest.update(raw)
+    return digest.hexdigest()
+
+
+def _path(key: str) -> Path:
+    # Read lazily — .env is only loaded once config is first needed
+    root = Path(os.getenv("LLM_CACHE_DIR", DEFAULT_CACHE_DIR))
+    return root / key[:2] / f"{key}.json"
+
+
+def get(key: str) -> Any | None:
+    """Return the cached value for ``key``, or None on a miss or expired entry."""
+    try:
+        entry = orjson.loads(_path(key).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(entry, dict) or entry.get("expiresAt", 0) < time.time():
+        return None
+    return entry.get("value")
+
+
+def set(key: str, value: Any, ttl: float = DEFAULT_TTL) -> None:
+    """Store ``value`` (JSON-serializable) under ``key`` for ``ttl`` seconds."""
+    path = _path(key)
+    entry = {"expiresAt": time.time() + ttl, "value": value}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees a partial file
+        tmp = path.with_suffix(f".{os.getpid()}.{time.monotonic_ns()}.tmp")
+        tmp.write_bytes(orjson.dumps(entry))
+        os.replace(tmp, path)
+    except (OSError, TypeError):
+        pass
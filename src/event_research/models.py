@@ -1,8 +1,10 @@
 """Data models for event research requests and venue results."""
 
 from __future__ import annotations
+from dataclasses import asdict, dataclass
 from enum import Enum
-from pydantic import BaseModel, Field
+from typing import Literal
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EventType(str, Enum):
@@ -11,9 +13,50 @@ class EventType(str, Enum):
     WORKSHOP = "workshop"
 
 
+class VenueStatus(str, Enum):
+    """Values of the Status select in the venue database."""
+
+    NEW = "New"
+    READY_FOR_OUTREACH = "Ready for Outreach"
+    CONTACTED = "Contacted"
+    RESPONDED = "Responded"
+    CONFIRMED = "Confirmed"
+    REJECTED = "Rejected"
+    ARCHIVED = "Archived"
+
+
+# Plain dict lookup for str -> EventType (skips Enum.__call__ machinery)
+EVENT_TYPE_BY_VALUE = {e.value: e for e in EventType}
+
+# Lowercased city spellings -> the canonical name stored in Notion's City select
+CITY_ALIASES = {
+    "new york": "New York",
+    "new york city": "New York",
+    "nyc": "New York",
+    "san francisco": "San Francisco",
+    "sf": "San Francisco",
+    "los angeles": "Los Angeles",
+    "chicago": "Chicago",
+    "boston": "Boston",
+    "seattle": "Seattle",
+    "austin": "Austin",
+    "miami": "Miami",
+    "denver": "Denver",
+    "london": "London",
+}
+
+
+def normalize_city(city: str) -> str:
+    """Canonical spelling of a city ("SF" -> "San Francisco"); unknown cities are just trimmed."""
+    city = city.strip()
+    return CITY_ALIASES.get(city.lower(), city)
+
+
 class EventBrief(BaseModel):
     """The intake: everything the user tells us about the event they want to host."""
 
+    model_config = ConfigDict(frozen=True)
+
     event_type: EventType
     city: str
     neighborhood: str | None = None
@@ -28,13 +71,19 @@ class EventBrief(BaseModel):
 
 
 class Venue(BaseModel):
-    """A single venue recommendation returned by the research agent."""
+    """A single venue recommendation returned by the research agent.
 
-    name: str
-    address: str
-    neighborhood: str
+    Frozen, so cached and looked-up venues can be shared without copying —
+    use ``model_copy(update=...)`` to annotate one.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = "Unknown"
+    address: str = "Unknown"
+    neighborhood: str = "Unknown"
     city: str
-    venue_type: str  # e.g. "restaurant - private dining", "event space"
+    venue_type: str = "Unknown"  # e.g. "restaurant - private dining", "event space"
     website: str | None = None
     phone: str | None = None
     email: str | None = None
@@ -97,6 +146,47 @@ class EnrichedVenue(BaseModel):
     neighborhood: str | None = None
 
 
+@dataclass(frozen=True)
+class EventDetails:
+    """Event details supplied directly (CLI flags / API fields) for email drafting.
+
+    A plain dataclass rather than a pydantic model — the values are already
+    typed by argparse / the request model, so there's nothing to validate.
+    """
+
+    event_type: str = "private event"
+    budget: str | None = None
+    guest_count: int | None = None
+    date: str | None = None
+    vibe: str | None = None
+    audience: str | None = None
+
+    def as_dict(self) -> dict:
+        """The dict shape the outreach prompts expect, without unset fields
+        (so templates fall back to their defaults instead of printing None)."""
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+
+class EnrichmentOutput(BaseModel):
+    """Schema for the return_enrichment tool — what contact enrichment reports back."""
+
+    contact_name: str | None = Field(default=None, description="Name of the events coordinator")
+    contact_title: str | None = Field(default=None, description="Their title, e.g. Events Director")
+    email: str | None = Field(default=None, description="Direct events email (not generic info@)")
+    phone: str | None = Field(default=None, description="Direct events phone number or extension")
+    private_events_url: str | None = Field(default=None, description="URL of the private events / dining page")
+    booking_form_url: str | None = Field(default=None, description="URL of an inquiry or booking form")
+    enrichment_notes: str | None = Field(default=None, description="Brief summary of what was found and source quality")
+    confidence: Literal["high", "medium", "low"] = "medium"
+
+
+class EmailOutput(BaseModel):
+    """Schema for the return_email tool — a drafted outreach email."""
+
+    subject: str = Field(description="Email subject line")
+    body: str = Field(description="Full email body")
+
+
 class OutreachResult(BaseModel):
     """Result of running outreach on one or more venues."""
 
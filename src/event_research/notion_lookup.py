@@ -8,29 +8,86 @@ from __future__ import annotations
 
 from notion_client import Client as NotionClient
 
+from event_research.cache import TTLCache
 from event_research.config import Config
-from event_research.models import EventBrief, Venue
-from event_research.notion_sync import get_notion_client
-from event_research.health_check import _extract_property_text
+from event_research.models import EventBrief, Venue, VenueStatus, normalize_city
+from event_research.notion_sync import _call_with_backoff, get_notion_client
+from event_research.health_check import _flatten_properties
+
+
+NOTION_LOOKUP_CACHE_TTL = 60  # seconds a (database, city, event type, guests) query is reused
+NOTION_LOOKUP_PAGE_SIZE = 25  # most existing venues we pull into one research run
+
+# Parsed candidates per (database, city, event type, guest count); the
+# loose neighborhood match is applied on top for each brief. Briefs with a
+# neighborhood need every city row (the match is client-side), so those are
+# cached separately from the capped first page.
+_lookup_cache = TTLCache(maxsize=128, ttl=NOTION_LOOKUP_CACHE_TTL)
 
 
 def find_matching_venues(brief: EventBrief, config: Config) -> list[Venue]:
     """Search Notion for existing venues that match the event brief.
 
     Filters by:
-      - City (exact match)
+      - City (exact match on the canonical spelling, then as given)
       - Event type in "Best For" (if available)
+      - Capacity Max at least the guest count (or unset)
       - Not archived
+      - Neighborhood (loose, client-side)
 
-    Returns Venue objects built from Notion data.
+    Returns up to NOTION_LOOKUP_PAGE_SIZE Venue objects built from Notion
+    data. Results of the Notion query are cached briefly, so back-to-back
+    briefs for the same city, event type and guest count share one
+    round-trip.
     """
-    notion = get_notion_client(config)
     db_id = config.notion_database_id
+    city = normalize_city(brief.city)
+    # The neighborhood filter runs after the query, so capping the query
+    # would drop matches past the first page of city rows
+    limit = None if brief.neighborhood else NOTION_LOOKUP_PAGE_SIZE
+    cache_key = f"{db_id}|{city}|{brief.event_type.value}|{brief.guest_count or ''}|{limit or 'all'}"
+
+    candidates = _lookup_cache.get(cache_key)
+    if candidates is None:
+        notion = get_notion_client(config)
+        candidates = _query_candidates(notion, db_id, brief, city, limit)
+        # The database may hold the city as typed ("SF") rather than canonically
+        raw_city = brief.city.strip()
+        if not candidates and raw_city != city:
+            candidates = _query_candidates(notion, db_id, brief, raw_city, limit)
+        if candidates is None:
+            return []
+        _lookup_cache.set(cache_key, candidates)
+
+    venues = []
+    for venue in candidates:
+        # If neighborhood is specified, filter loosely
+        if brief.neighborhood:
+            venue_neighborhood = venue.neighborhood.lower()
+            brief_neighborhood = brief.neighborhood.lower()
+            if brief_neighborhood not in venue_neighborhood and venue_neighborhood not in brief_neighborhood:
+                continue
+
+        # Venues are frozen, so cached candidates can be handed out as-is
+        venues.append(venue)
+        if len(venues) == NOTION_LOOKUP_PAGE_SIZE:
+            break
 
+    return venues
+
+
+def _query_candidates(
+    notion: NotionClient, db_id: str, brief: EventBrief, city: str, limit: int | None,
+) -> list[Venue] | None:
+    """Query Notion for non-archived venues in ``city`` matching the brief's event type and guest count.
+
+    Fetches one page of ``limit`` rows, or every matching row when ``limit``
+    is None. Returns None if the query fails, so failures aren't cached.
+    """
     # Build filter
     filters = [
-        {"property": "Status", "select": {"does_not_equal": "Archived"}},
-        {"property": "City", "select": {"equals": brief.city}},
+        {"property": "Status", "select": {"does_not_equal": VenueStatus.ARCHIVED.value}},
+        {"property": "City", "select": {"equals": city}},
     ]
 
     # Add event type filter if we can
@@ -40,82 +97,64 @@ def find_matching_venues(brief: EventBrief, config: Config) -> list[Venue]:
         "multi_select": {"contains": brief.event_type.value},
     })
 
+    # Venues with no Capacity Max recorded still count as candidates
+    if brief.guest_count:
+        filters.append({"or": [
+            {"property": "Capacity Max", "number": {"greater_than_or_equal_to": brief.guest_count}},
+            {"property": "Capacity Max", "number": {"is_empty": True}},
+        ]})
+
+    kwargs = {"database_id": db_id, "filter": {"and": filters}}
+    if limit:
+        kwargs["page_size"] = limit
+
+    venues = []
     try:
-        results = notion.databases.query(
-            database_id=db_id,
-            filter={"and": filters},
-        )
+        while True:
+            results = _call_with_backoff(notion.databases.query, **kwargs)
+            for page in results.get("results", []):
+                venue = _page_to_venue(page)
+                if venue:
+                    venues.append(venue)
+            if limit or not results.get("has_more"):
+                break
+            kwargs["start_cursor"] = results.get("next_cursor")
     except Exception:
         # If the filter fails (e.g., city doesn't exist yet), return empty
-        return []
-
-    venues = []
-    for page in results.get("results", []):
-        venue = _page_to_venue(page)
-        if venue:
-            # If neighborhood is specified, filter loosely
-            if brief.neighborhood:
-                venue_neighborhood = venue.neighborhood.lower()
-                brief_neighborhood = brief.neighborhood.lower()
-                if brief_neighborhood not in venue_neighborhood and venue_neighborhood not in brief_neighborhood:
-                    continue
-
-            # If guest count specified, check capacity
-            if brief.guest_count and venue.capacity_max:
-                if venue.capacity_max < brief.guest_count:
-                    continue
-
-            venues.append(venue)
-
+        return None
     return venues
 
 
 def _page_to_venue(page: dict) -> Venue | None:
     """Convert a Notion page back into a Venue object."""
     try:
-        name = _extract_property_text(page, "Name")
+        props = _flatten_properties(page)
+        name = props.get("Name")
         if not name:
             return None
 
-        # Extract checkbox values
-        def get_checkbox(prop_name):
-            prop = page.get("properties", {}).get(prop_name, {})
-            return prop.get("checkbox") if prop.get("type") == "checkbox" else None
-
-        # Extract number values
-        def get_number(prop_name):
-            prop = page.get("properties", {}).get(prop_name, {})
-            return prop.get("number") if prop.get("type") == "number" else None
-
-        # Extract multi-select
-        def get_multi_select(prop_name):
-            prop = page.get("properties", {}).get(prop_name, {})
-            if prop.get("type") == "multi_select":
-                return [opt.get("name", "") for opt in prop.get("multi_select", [])]
-            return []
-
         return Venue(
             name=name,
-            address=_extract_property_text(page, "Address") or "Unknown",
-            neighborhood=_extract_property_text(page, "Neighborhood") or "Unknown",
-            city=_extract_property_text(page, "City") or "Unknown",
-            venue_type=_extract_property_text(page, "Venue Type") or "Unknown",
-            website=_extract_property_text(page, "Website") or None,
-            phone=_extract_property_text(page, "Phone") or None,
-            email=_extract_property_text(page, "Email") or None,
-            contact_name=_extract_property_text(page, "Contact Name") or None,
-            price_range=_extract_property_text(page, "Price Range") or None,
-            estimated_cost=_extract_property_text(page, "Estimated Cost") or None,
-            capacity_min=get_number("Capacity Min"),
-            capacity_max=get_number("Capacity Max"),
-            private_space=get_checkbox("Private Space"),
-            av_available=get_checkbox("AV Available"),
-            outdoor_space=get_checkbox("Outdoor Space"),
-            cuisine_or_style=_extract_property_text(page, "Cuisine / Style") or None,
-            best_for=get_multi_select("Best For"),
-            highlights=_extract_property_text(page, "Highlights") or None,
-            source_url=_extract_property_text(page, "Source URL") or None,
-            confidence=_extract_property_text(page, "Confidence").lower() or "medium",
+            address=props.get("Address") or "Unknown",
+            neighborhood=props.get("Neighborhood") or "Unknown",
+            city=props.get("City") or "Unknown",
+            venue_type=props.get("Venue Type") or "Unknown",
+            website=props.get("Website") or None,
+            phone=props.get("Phone") or None,
+            email=props.get("Email") or None,
+            contact_name=props.get("Contact Name") or None,
+            price_range=props.get("Price Range") or None,
+            estimated_cost=props.get("Estimated Cost") or None,
+            capacity_min=props.get("Capacity Min"),
+            capacity_max=props.get("Capacity Max"),
+            private_space=props.get("Private Space"),
+            av_available=props.get("AV Available"),
+            outdoor_space=props.get("Outdoor Space"),
+            cuisine_or_style=props.get("Cuisine / Style") or None,
+            best_for=props.get("Best For") or [],
+            highlights=props.get("Highlights") or None,
+            source_url=props.get("Source URL") or None,
+            confidence=(props.get("Confidence") or "").lower() or "medium",
         )
     except Exception:
         return None
@@ -5,60 +5,276 @@ Also handles outreach updates (enriched contacts, email drafts, status changes).
 
 from __future__ import annotations
 
-from datetime import date
-
+import functools
+import random
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from itertools import islice
+
+import httpx
 from notion_client import Client as NotionClient
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
 
+from event_research.cache import TTLCache
 from event_research.config import Config
-from event_research.models import EnrichedVenue, Venue, ResearchResult
+from event_research.models import EnrichedVenue, Venue, VenueStatus, ResearchResult
+from event_research.ratelimit import RateLimiter
+
+NOTION_MAX_CONCURRENCY = 3  # Notion's per-integration concurrency guidance
+# Page creates in flight during a push. Higher than the guidance above
+# because every call first takes a slot from _notion_limiter, whose burst is
+# capped at NOTION_RPS — so the request rate stays at NOTION_RPS however many
+# workers wait, and the extra workers only hide per-request latency.
+NOTION_PUSH_CONCURRENCY = 5
+NOTION_RPS = 3  # Notion's average request-rate limit per integration
+NOTION_MAX_RETRIES = 4  # up to 5 attempts per call
+NOTION_MAX_BACKOFF = 32  # seconds, before jitter
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+_VALID_STATUSES = frozenset(s.value for s in VenueStatus)
+DEDUP_FILTER_CHUNK = 50  # venues per duplicate-check query (two OR clauses each)
+NOTION_RICH_TEXT_LIMIT = 2000  # max characters in one rich_text object
+MAX_BLOCK_DEPTH = 3  # levels of nested blocks read below a page
+VENUE_INDEX_TTL = 60  # seconds a venue's exists / doesn't-exist answer is trusted
+PAGE_CACHE_TTL = 300  # seconds a retrieved page / page's text is reused
+
+# Paces bulk writes to Notion's average rate. The bucket only holds about a
+# second's worth of requests, so even a short push is paced rather than sent
+# as one burst. Requests have no token cost, so only the RPM side applies.
+_notion_limiter = RateLimiter(rpm=NOTION_RPS * 60, tpm=1, burst=NOTION_RPS)
+
+# "{database}|(name, city)" -> whether that venue is in the database. Fed by
+# duplicate checks, page creates and full-database scans, so a push right
+# after a health check or another push needs no duplicate queries at all.
+_venue_index = TTLCache(maxsize=4096, ttl=VENUE_INDEX_TTL)
+
+# page_id -> retrieved page (dropped whenever we write to that page), and
+# page_id -> plain text for linked project pages
+_page_cache = TTLCache(maxsize=256, ttl=PAGE_CACHE_TTL)
+_content_cache = TTLCache(maxsize=64, ttl=PAGE_CACHE_TTL)
+
+
+# One Notion client per token for the life of the process, so every query,
+# page create and update reuses pooled keep-alive connections instead of
+# paying a fresh TLS handshake per call. Deliberately not shared with the
+# Anthropic pool: notion-client sets its auth header and base URL on the
+# httpx client it's given.
+_notion_clients: dict[str, NotionClient] = {}
+_notion_clients_lock = threading.Lock()
 
 
 def get_notion_client(config: Config) -> NotionClient:
-    return NotionClient(auth=config.notion_api_key)
+    """Return a shared Notion client for the configured integration token."""
+    key = config.notion_api_key
+    client = _notion_clients.get(key)
+    if client is None:
+        with _notion_clients_lock:
+            client = _notion_clients.get(key)
+            if client is None:
+                client = NotionClient(
+                    auth=key,
+                    client=httpx.Client(
+                        limits=httpx.Limits(
+                            max_keepalive_connections=10, max_connections=20, keepalive_expiry=60.0,
+                        ),
+                    ),
+                )
+                _notion_clients[key] = client
+    return client
+
+
+def close_notion_clients() -> None:
+    """Close the pooled Notion connections (called on API shutdown)."""
+    with _notion_clients_lock:
+        for client in _notion_clients.values():
+            client.close()
+        _notion_clients.clear()
+
+
+@functools.lru_cache(maxsize=2)
+def _iso_for_ordinal(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat()
+
+
+def today_iso() -> str:
+    """Today's date as an ISO string, formatted once per day.
+
+    Batch callers should grab this once and pass it down, so every page
+    written in one run gets the same date even if the run crosses midnight.
+    """
+    return _iso_for_ordinal(date.today().toordinal())
+
 
+def _call_with_backoff(fn, *, idempotent: bool = True, **kwargs):
+    """Call a Notion endpoint under the rate limiter, retrying transient failures.
 
-def push_results_to_notion(result: ResearchResult, config: Config) -> list[str]:
-    """Push venue results to Notion database. Returns list of created page URLs."""
+    Retries 429s, 5xx / gateway errors and client timeouts. Waits for
+    Retry-After when Notion sends it, otherwise backs off exponentially
+    (capped at NOTION_MAX_BACKOFF) with jitter; a 429 also slows the shared
+    limiter down. Every call into Notion should go through here.
+
+    Pass ``idempotent=False`` for calls such as pages.create: those are only
+    retried on 429, since a timed-out or 5xx request may still have landed
+    and a retry would duplicate it.
+    """
+    for attempt in range(NOTION_MAX_RETRIES + 1):
+        _notion_limiter.acquire(0)
+        try:
+            return fn(**kwargs)
+        except (HTTPResponseError, RequestTimeoutError) as e:
+            status = getattr(e, "status", None)
+            if (status is not None and status not in _RETRY_STATUSES) or attempt == NOTION_MAX_RETRIES:
+                raise
+            if not idempotent and status != 429:
+                raise
+            if status == 429:
+                _notion_limiter.backoff()
+            retry_after = e.headers.get("retry-after", "") if status is not None else ""
+            if retry_after.isdigit():
+                wait = float(retry_after)
+            else:
+                wait = min(NOTION_MAX_BACKOFF, 2 ** attempt) + random.random()
+            print(f"  ⏳ Notion {status or 'timeout'} — retrying in {wait:.1f}s ({attempt + 1}/{NOTION_MAX_RETRIES})")
+            time.sleep(wait)
+
+
+def push_results_to_notion(
+    result: ResearchResult, config: Config, concurrency: int = NOTION_PUSH_CONCURRENCY,
+) -> list[str]:
+    """Push venue results to Notion database. Returns list of created page URLs.
+
+    Venues are written through a pool of ``concurrency`` threads while
+    calls are paced to NOTION_RPS and retried on 429 / gateway errors, so
+    a push is bound by Notion's rate limit rather than by round-trip
+    latency.
+    """
 
     notion = get_notion_client(config)
     db_id = config.notion_database_id
-    created_urls = []
+    build_properties = _props_builder(result.brief.event_type.value)
 
+    # Drop in-batch duplicates up front — concurrent pushes can't rely on
+    # the existence check to catch a venue created moments earlier
+    seen = set()
+    venues = []
     for venue in result.venues:
-        # Check if venue already exists (by name + city)
-        existing = _find_existing_venue(notion, db_id, venue.name, venue.city)
-        if existing:
-            print(f"  ⏭️  '{venue.name}' already in Notion — skipping")
-            continue
+        key = _venue_slug(venue.name, venue.city)
+        if key not in seen:
+            seen.add(key)
+            venues.append(venue)
 
-        # Build Notion page properties
-        properties = _venue_to_notion_properties(venue, result.brief.event_type.value)
+    # Duplicate check for the whole batch up front, then a set lookup per venue
+    use_slug = _ensure_slug_property(notion, db_id)
+    existing = _find_existing_keys(notion, db_id, venues, use_slug)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        urls = list(pool.map(
+            lambda venue: _push_venue(notion, db_id, venue, build_properties, existing, use_slug),
+            venues,
+        ))
+
+    return [url for url in urls if url is not None]
 
-        try:
-            page = notion.pages.create(
-                parent={"database_id": db_id},
-                properties=properties,
-            )
-            url = page.get("url", "")
-            created_urls.append(url)
-            print(f"  ✅ Added '{venue.name}' to Notion")
-        except Exception as e:
-            print(f"  ❌ Failed to add '{venue.name}': {e}")
 
-    return created_urls
+def _push_venue(
+    notion: NotionClient,
+    db_id: str,
+    venue: Venue,
+    build_properties: Callable[[Venue], dict],
+    existing: set[str],
+    use_slug: bool = False,
+) -> str | None:
+    """Create a Notion page for one venue. Returns its URL, or None if skipped/failed."""
+    # Skip venues already in the database (by name + city)
+    slug = _venue_slug(venue.name, venue.city)
+    if slug in existing:
+        print(f"  ⏭️  '{venue.name}' already in Notion — skipping")
+        return None
+
+    # Build Notion page properties
+    properties = build_properties(venue)
+    if use_slug:
+        properties["Slug"] = _rich_text(slug)
+
+    try:
+        page = _call_with_backoff(
+            notion.pages.create,
+            idempotent=False,
+            parent={"database_id": db_id},
+            properties=properties,
+        )
+        _venue_index.set(f"{db_id}|{slug}", True)
+        print(f"  ✅ Added '{venue.name}' to Notion")
+        return page.get("url", "")
+    except Exception as e:
+        print(f"  ❌ Failed to add '{venue.name}': {e}")
+        return None
+
+
+def _rich_text(value: str) -> dict:
+    return {"rich_text": [{"text": {"content": value}}]}
+
+
+# Optional Venue fields -> Notion property names, grouped by property type.
+# Text fields are written when non-empty, numbers and checkboxes when not None.
+_RICH_TEXT_FIELDS = (
+    ("contact_name", "Contact Name"),
+    ("price_range", "Price Range"),
+    ("estimated_cost", "Estimated Cost"),
+    ("cuisine_or_style", "Cuisine / Style"),
+    ("highlights", "Highlights"),
+)
+_URL_FIELDS = (("website", "Website"), ("source_url", "Source URL"))
+_NUMBER_FIELDS = (("capacity_min", "Capacity Min"), ("capacity_max", "Capacity Max"))
+_CHECKBOX_FIELDS = (
+    ("private_space", "Private Space"),
+    ("av_available", "AV Available"),
+    ("outdoor_space", "Outdoor Space"),
+)
 
 
 def _venue_to_notion_properties(venue: Venue, event_type: str) -> dict:
     """Convert a Venue model to Notion page properties."""
+    return _props_builder(event_type)(venue)
+
+
+# Constant property values, built once and shared by every page written.
+# Plain dicts (json.dumps can't encode MappingProxyType) — never mutate them.
+_STATUS_SELECT = {s.value: {"select": {"name": s.value}} for s in VenueStatus}
+_NEW_STATUS = _STATUS_SELECT[VenueStatus.NEW.value]
+_CONFIDENCE_SELECT = {c: {"select": {"name": c.capitalize()}} for c in ("low", "medium", "high")}
+
+
+@functools.lru_cache(maxsize=8)
+def _props_builder(event_type: str) -> Callable[[Venue], dict]:
+    """A Venue -> Notion properties converter with ``event_type`` baked in.
+
+    A push writes every venue with the same event type, so the batch builds
+    this once and the per-venue path only handles per-venue fields.
+    """
+    researched_for = {"select": {"name": event_type}}
+
+    def build(venue: Venue) -> dict:
+        return _build_venue_properties(venue, researched_for)
+
+    return build
 
+
+def _build_venue_properties(venue: Venue, researched_for: dict) -> dict:
     props: dict = {
         "Name": {"title": [{"text": {"content": venue.name}}]},
-        "Address": {"rich_text": [{"text": {"content": venue.address}}]},
-        "Neighborhood": {"rich_text": [{"text": {"content": venue.neighborhood}}]},
+        "Address": _rich_text(venue.address),
+        "Neighborhood": _rich_text(venue.neighborhood),
         "City": {"select": {"name": venue.city}},
-        "Venue Type": {"rich_text": [{"text": {"content": venue.venue_type}}]},
-        "Status": {"select": {"name": "New"}},
-        "Confidence": {"select": {"name": venue.confidence.capitalize()}},
+        "Venue Type": _rich_text(venue.venue_type),
+        "Status": _NEW_STATUS,
+        "Confidence": _CONFIDENCE_SELECT.get(venue.confidence)
+        or {"select": {"name": venue.confidence.capitalize()}},
+        # Researched For Event Type
+        "Researched For": researched_for,
     }
 
     # Best For — multi-select
@@ -67,102 +283,260 @@ def _venue_to_notion_properties(venue: Venue, event_type: str) -> dict:
             "multi_select": [{"name": t} for t in venue.best_for]
         }
 
-    # Researched For Event Type
-    props["Researched For"] = {"select": {"name": event_type}}
-
-    # Optional text fields
-    if venue.website:
-        props["Website"] = {"url": venue.website}
+    # Optional fields, one pass per property type
+    for attr, prop_name in _RICH_TEXT_FIELDS:
+        if value := getattr(venue, attr):
+            props[prop_name] = _rich_text(value)
+    for attr, prop_name in _URL_FIELDS:
+        if value := getattr(venue, attr):
+            props[prop_name] = {"url": value}
+    for attr, prop_name in _NUMBER_FIELDS:
+        if (value := getattr(venue, attr)) is not None:
+            props[prop_name] = {"number": value}
+    for attr, prop_name in _CHECKBOX_FIELDS:
+        if (value := getattr(venue, attr)) is not None:
+            props[prop_name] = {"checkbox": value}
     if venue.phone:
         props["Phone"] = {"phone_number": venue.phone}
     if venue.email:
         props["Email"] = {"email": venue.email}
-    if venue.contact_name:
-        props["Contact Name"] = {"rich_text": [{"text": {"content": venue.contact_name}}]}
-    if venue.price_range:
-        props["Price Range"] = {"rich_text": [{"text": {"content": venue.price_range}}]}
-    if venue.estimated_cost:
-        props["Estimated Cost"] = {"rich_text": [{"text": {"content": venue.estimated_cost}}]}
-    if venue.capacity_min is not None:
-        props["Capacity Min"] = {"number": venue.capacity_min}
-    if venue.capacity_max is not None:
-        props["Capacity Max"] = {"number": venue.capacity_max}
-    if venue.cuisine_or_style:
-        props["Cuisine / Style"] = {"rich_text": [{"text": {"content": venue.cuisine_or_style}}]}
-    if venue.highlights:
-        props["Highlights"] = {"rich_text": [{"text": {"content": venue.highlights}}]}
-    if venue.source_url:
-        props["Source URL"] = {"url": venue.source_url}
-
-    # Boolean fields
-    if venue.private_space is not None:
-        props["Private Space"] = {"checkbox": venue.private_space}
-    if venue.av_available is not None:
-        props["AV Available"] = {"checkbox": venue.av_available}
-    if venue.outdoor_space is not None:
-        props["Outdoor Space"] = {"checkbox": venue.outdoor_space}
 
     return props
 
 
-def _find_existing_venue(
-    notion: NotionClient, db_id: str, name: str, city: str
-) -> dict | None:
-    """Check if a venue with the same name + city already exists."""
-    try:
-        results = notion.databases.query(
-            database_id=db_id,
-            filter={
-                "and": [
-                    {"property": "Name", "title": {"equals": name}},
-                    {"property": "City", "select": {"equals": city}},
-                ]
-            },
-        )
-        if results["results"]:
-            return results["results"][0]
-    except Exception:
-        pass
-    return None
+_SLUG_SEP_RE = re.compile(r"[\W_]+")
+
+
+def _venue_slug(name: str, city: str) -> str:
+    """Canonical dedup key for a venue: "The Bar, Inc." / "NYC" -> "the-bar-inc-nyc".
+
+    Insensitive to case, whitespace and punctuation, so near-identical
+    names from different research runs collapse to one row.
+    """
+    return _SLUG_SEP_RE.sub("-", f"{name} {city}".casefold()).strip("-")
+
+
+def _page_key(page: dict) -> str | None:
+    props = page.get("properties", {})
+    stored = (props.get("Slug", {}).get("rich_text") or [{}])[0].get("plain_text")
+    if stored:
+        return stored
+    title = props.get("Name", {}).get("title") or []
+    if not title:
+        return None
+    city = (props.get("City", {}).get("select") or {}).get("name", "")
+    return _venue_slug(title[0].get("plain_text", ""), city)
+
+
+# Databases we've already tried to give a Slug column: db_id -> whether it has one
+_slug_databases: dict[str, bool] = {}
+
+
+def _ensure_slug_property(notion: NotionClient, db_id: str) -> bool:
+    """Make sure the database has a Slug rich_text property, checked once per process.
+
+    The schema is read first and the property is only added when it's
+    absent; an existing Slug of another type is never retyped. Returns
+    False if the schema can't be read or updated (e.g. the integration
+    lacks permission) or Slug has the wrong type, in which case dedup falls
+    back to Name + City — the push itself always goes ahead.
+    """
+    has_slug = _slug_databases.get(db_id)
+    if has_slug is None:
+        try:
+            database = _call_with_backoff(notion.databases.retrieve, database_id=db_id)
+        except Exception:
+            database = None
+        existing = (database or {}).get("properties", {}).get("Slug")
+        if database is None:
+            has_slug = False
+        elif existing is None:
+            try:
+                _call_with_backoff(notion.databases.update, database_id=db_id, properties={"Slug": {"rich_text": {}}})
+                has_slug = True
+            except Exception:
+                has_slug = False
+        elif existing.get("type") == "rich_text":
+            has_slug = True
+        else:
+            # It's the user's column — never retype it, just dedup without it
+            print(
+                f"  ⚠️  Notion 'Slug' property is {existing.get('type')!r}, not rich_text — "
+                "deduplicating on Name + City instead"
+            )
+            has_slug = False
+        _slug_databases[db_id] = has_slug
+    return has_slug
+
+
+def _find_existing_keys(
+    notion: NotionClient, db_id: str, venues: list[Venue], use_slug: bool = False,
+) -> set[str]:
+    """Slugs of the given venues that already exist in the database.
+
+    Venues the index already knows about cost nothing; the rest are
+    checked with one OR-query per DEDUP_FILTER_CHUNK venues and recorded
+    in the index. Each venue matches on its Slug (when the database has
+    one) or on exact Name + City, which also covers rows created before
+    slugs existed. A chunk whose query fails is treated as having no
+    matches (and isn't recorded).
+    """
+    existing = set()
+    unknown = []
+    for venue in venues:
+        key = _venue_slug(venue.name, venue.city)
+        known = _venue_index.get(f"{db_id}|{key}")
+        if known is None:
+            unknown.append(venue)
+        elif known:
+            existing.add(key)
+
+    for i in range(0, len(unknown), DEDUP_FILTER_CHUNK):
+        chunk = unknown[i:i + DEDUP_FILTER_CHUNK]
+        clauses = []
+        for venue in chunk:
+            if use_slug:
+                clauses.append({"property": "Slug", "rich_text": {"equals": _venue_slug(venue.name, venue.city)}})
+            clauses.append({"and": [
+                {"property": "Name", "title": {"equals": venue.name}},
+                {"property": "City", "select": {"equals": venue.city}},
+            ]})
+        query_filter = {"or": clauses}
+        found = set()
+        start_cursor = None
+        try:
+            while True:
+                kwargs = {"database_id": db_id, "filter": query_filter}
+                if start_cursor:
+                    kwargs["start_cursor"] = start_cursor
+                results = _call_with_backoff(notion.databases.query, **kwargs)
+                for page in results["results"]:
+                    key = _page_key(page)
+                    if key:
+                        found.add(key)
+                if not results.get("has_more"):
+                    break
+                start_cursor = results.get("next_cursor")
+        except Exception:
+            continue
+
+        for venue in chunk:
+            key = _venue_slug(venue.name, venue.city)
+            _venue_index.set(f"{db_id}|{key}", key in found)
+        existing |= found
+    return existing
+
+
+class PageUpdater:
+    """Collects property patches for one page and writes them in a single pages.update.
+
+    Use as a context manager (the write happens on a clean exit) or call
+    ``flush()`` directly::
+
+        with PageUpdater(notion, page_id) as page:
+            page.set_status("Archived")
+            page.stamp_last_checked()
+
+    Properties set with ``optional=True`` may be missing from the database;
+    if the write fails, it's retried once without them.
+    """
+
+    def __init__(self, notion: NotionClient, page_id: str):
+        self.notion = notion
+        self.page_id = page_id
+        self.properties: dict = {}
+        self._optional: set[str] = set()
+
+    def set(self, name: str, value: dict, optional: bool = False) -> None:
+        self.properties[name] = value
+        if optional:
+            self._optional.add(name)
+
+    def set_status(self, status: VenueStatus | str) -> None:
+        status = getattr(status, "value", status)
+        self.set("Status", _STATUS_SELECT.get(status) or {"select": {"name": status}})
+
+    def stamp_last_checked(self, today: str | None = None) -> None:
+        # Older databases don't have this column yet
+        self.set("Date Last Checked", {"date": {"start": today or today_iso()}}, optional=True)
+
+    def flush(self) -> None:
+        properties, self.properties = self.properties, {}
+        optional, self._optional = self._optional, set()
+        if not properties:
+            return
+        _page_cache.pop(self.page_id)
+        try:
+            _call_with_backoff(self.notion.pages.update, page_id=self.page_id, properties=properties)
+        except Exception:
+            required = {name: value for name, value in properties.items() if name not in optional}
+            if len(required) == len(properties):
+                raise
+            if required:
+                _call_with_backoff(self.notion.pages.update, page_id=self.page_id, properties=required)
+
+    def __enter__(self) -> PageUpdater:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
 
 
 def archive_venue(notion: NotionClient, page_id: str) -> None:
     """Archive a venue by setting its status to Archived."""
     try:
-        notion.pages.update(
-            page_id=page_id,
-            properties={"Status": {"select": {"name": "Archived"}}},
-        )
+        with PageUpdater(notion, page_id) as page:
+            page.set_status(VenueStatus.ARCHIVED)
     except Exception as e:
         print(f"  ❌ Failed to archive venue: {e}")
 
 
-def get_all_venues(config: Config) -> list[dict]:
+def get_all_venues(config: Config, since: datetime | None = None) -> list[dict]:
     """Fetch all non-archived venues from the Notion database."""
+    return list(iter_all_venues(config, since=since))
+
+
+def iter_all_venues(config: Config, since: datetime | None = None) -> Iterator[dict]:
+    """Yield non-archived venue pages as each page of query results arrives.
+
+    Lets callers start work on the first results while later pages are
+    still being fetched. With ``since``, only pages edited at or after that
+    time are fetched — pass the newest ``last_edited_time`` from a previous
+    sync to pick up just the changes.
+    """
     notion = get_notion_client(config)
-    all_pages = []
     start_cursor = None
 
+    query_filter = {
+        "property": "Status",
+        "select": {"does_not_equal": VenueStatus.ARCHIVED.value},
+    }
+    if since is not None:
+        query_filter = {"and": [
+            query_filter,
+            {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": since.isoformat()}},
+        ]}
+
     while True:
         kwargs = {
             "database_id": config.notion_database_id,
-            "filter": {
-                "property": "Status",
-                "select": {"does_not_equal": "Archived"},
-            },
+            "filter": query_filter,
         }
         if start_cursor:
             kwargs["start_cursor"] = start_cursor
 
-        results = notion.databases.query(**kwargs)
-        all_pages.extend(results["results"])
+        results = _call_with_backoff(notion.databases.query, **kwargs)
+        for page in results["results"]:
+            key = _page_key(page)
+            if key:
+                _venue_index.set(f"{config.notion_database_id}|{key}", True)
+            yield page
 
         if not results.get("has_more"):
             break
         start_cursor = results.get("next_cursor")
 
-    return all_pages
-
 
 # ---- Outreach functions ----
 
@@ -170,7 +544,8 @@ def get_venues_for_outreach(
     config: Config,
     city: str | None = None,
     venue_name: str | None = None,
-    status_filter: list[str] | None = None,
+    status_filter: Iterable[str] | None = None,
+    limit: int = 0,
 ) -> list[dict]:
     """Query venues that are ready for outreach.
 
@@ -178,12 +553,37 @@ def get_venues_for_outreach(
         config: App config
         city: Filter by city (exact match)
         venue_name: Filter by venue name (contains match)
-        status_filter: Status values to include (default: New, Ready for Outreach)
+        status_filter: Status values to include (default: New, Ready for Outreach).
+            Any iterable; duplicates are dropped.
+        limit: Max venues to return (0 = all); stops paginating once reached
+
+    Returns an empty list if the Notion query fails.
+    """
+    pages = iter_venues_for_outreach(config, city=city, venue_name=venue_name, status_filter=status_filter)
+    if limit > 0:
+        pages = islice(pages, limit)
+    try:
+        return list(pages)
+    except Exception:
+        return []
+
+
+def iter_venues_for_outreach(
+    config: Config,
+    city: str | None = None,
+    venue_name: str | None = None,
+    status_filter: Iterable[str] | None = None,
+) -> Iterator[dict]:
+    """Yield venues ready for outreach as each page of query results arrives.
+
+    Same filters as get_venues_for_outreach; query errors propagate.
     """
     notion = get_notion_client(config)
 
     if status_filter is None:
-        status_filter = ["New", "Ready for Outreach"]
+        status_filter = [VenueStatus.NEW.value, VenueStatus.READY_FOR_OUTREACH.value]
+    else:
+        status_filter = list(dict.fromkeys(status_filter))
 
     # Build filter
     filters = []
@@ -219,7 +619,6 @@ def get_venues_for_outreach(
     # Combine filters
     query_filter = {"and": filters} if len(filters) > 1 else filters[0] if filters else None
 
-    all_pages = []
     start_cursor = None
 
     while True:
@@ -229,25 +628,29 @@ def get_venues_for_outreach(
         if start_cursor:
             kwargs["start_cursor"] = start_cursor
 
-        try:
-            results = notion.databases.query(**kwargs)
-        except Exception:
-            return []
-
-        all_pages.extend(results["results"])
+        results = _call_with_backoff(notion.databases.query, **kwargs)
+        yield from results["results"]
 
         if not results.get("has_more"):
             break
         start_cursor = results.get("next_cursor")
 
-    return all_pages
-
 
 def get_venue_by_page_id(config: Config, page_id: str) -> dict | None:
-    """Fetch a single venue page by its Notion page ID."""
+    """Fetch a single venue page by its Notion page ID.
+
+    Pages are cached for PAGE_CACHE_TTL seconds; writes through
+    PageUpdater drop the cached copy.
+    """
+    page = _page_cache.get(page_id)
+    if page is not None:
+        return page
+
     notion = get_notion_client(config)
     try:
-        return notion.pages.retrieve(page_id=page_id)
+        page = _call_with_backoff(notion.pages.retrieve, page_id=page_id)
+        _page_cache.set(page_id, page)
+        return page
     except Exception as e:
         print(f"  \u274c Failed to fetch page {page_id}: {e}")
         return None
@@ -280,40 +683,105 @@ def fetch_page_content(config: Config, page_id: str) -> str | None:
 
     Accepts a page ID (UUID) or a Notion URL like:
       https://www.notion.so/workspace/Page-Title-abc123def456
+
+    Follows pagination past Notion's 100-block limit and pulls in nested
+    blocks (toggles, columns, lists) up to MAX_BLOCK_DEPTH levels deep,
+    fetching each level's children concurrently.
+
+    The text is cached for PAGE_CACHE_TTL seconds, so repeat reads of a
+    page within that window cost no requests at all.
     """
     notion = get_notion_client(config)
 
     # Extract page ID from URL if needed
     page_id = _extract_page_id_from_url(page_id)
 
-    try:
-        # Fetch the page blocks (content)
-        blocks = notion.blocks.children.list(block_id=page_id)
-        text_parts = []
-        for block in blocks.get("results", []):
-            block_type = block.get("type", "")
-            block_data = block.get(block_type, {})
-
-            # Extract text from rich_text arrays in various block types
-            rich_texts = block_data.get("rich_text", [])
-            for rt in rich_texts:
-                plain_text = rt.get("plain_text", "")
-                if plain_text:
-                    text_parts.append(plain_text)
-
-            # Also check for "text" in some block types
-            if "text" in block_data:
-                for rt in block_data["text"]:
-                    plain_text = rt.get("plain_text", "")
-                    if plain_text:
-                        text_parts.append(plain_text)
-
-        return "\n".join(text_parts) if text_parts else None
+    cached = _content_cache.get(page_id)
+    if cached is not None:
+        return cached
 
+    try:
+        text = _fetch_block_text(notion, page_id)
     except Exception as e:
         print(f"  \u26a0\ufe0f  Failed to fetch page content: {e}")
         return None
 
+    _content_cache.set(page_id, text)
+    return text
+
+
+def _fetch_block_text(notion: NotionClient, page_id: str) -> str | None:
+    """A page's block tree flattened to plain text (None if it has no text)."""
+    children = {page_id: _list_blocks(notion, page_id)}
+
+    # Fetch nested blocks one level at a time, each level in parallel
+    frontier = _blocks_with_children(children[page_id])
+    with ThreadPoolExecutor(max_workers=NOTION_MAX_CONCURRENCY) as pool:
+        for _ in range(MAX_BLOCK_DEPTH):
+            if not frontier:
+                break
+            for block_id, blocks in zip(frontier, pool.map(lambda bid: _list_blocks_or_empty(notion, bid), frontier)):
+                children[block_id] = blocks
+            frontier = [bid for block_id in frontier for bid in _blocks_with_children(children[block_id])]
+
+    # Walk the tree in document order
+    text_parts = []
+
+    def collect(block_id: str) -> None:
+        for block in children.get(block_id, ()):
+            text_parts.extend(_block_text_parts(block))
+            collect(block["id"])
+
+    collect(page_id)
+    return "\n".join(text_parts) if text_parts else None
+
+
+def _list_blocks(notion: NotionClient, block_id: str) -> list[dict]:
+    """All child blocks of a block or page, across every page of results."""
+    blocks = []
+    start_cursor = None
+    while True:
+        kwargs = {"block_id": block_id}
+        if start_cursor:
+            kwargs["start_cursor"] = start_cursor
+        results = _call_with_backoff(notion.blocks.children.list, **kwargs)
+        blocks.extend(results.get("results", []))
+        if not results.get("has_more"):
+            return blocks
+        start_cursor = results.get("next_cursor")
+
+
+def _list_blocks_or_empty(notion: NotionClient, block_id: str) -> list[dict]:
+    # A nested block we can't read shouldn't sink the rest of the page
+    try:
+        return _list_blocks(notion, block_id)
+    except Exception:
+        return []
+
+
+def _blocks_with_children(blocks: list[dict]) -> list[str]:
+    # Child pages and databases are separate documents, not page content
+    return [
+        block["id"] for block in blocks
+        if block.get("has_children") and block.get("type") not in ("child_page", "child_database")
+    ]
+
+
+# Block fields that hold rich-text arrays (paragraphs, headings, to-dos,
+# legacy "text" blocks, image/code captions)
+_RICH_TEXT_KEYS = ("rich_text", "text", "caption")
+
+
+def _block_text_parts(block: dict) -> list[str]:
+    """Plain-text fragments of a single block, in one pass over its rich-text fields."""
+    block_data = block.get(block.get("type", ""), {})
+    return [
+        plain_text
+        for key in _RICH_TEXT_KEYS
+        for rt in block_data.get(key, ())
+        if (plain_text := rt.get("plain_text"))
+    ]
+
 
 def _extract_page_id_from_url(url_or_id: str) -> str:
     """Extract a Notion page ID from a URL or return as-is if already an ID.
@@ -323,7 +791,6 @@ def _extract_page_id_from_url(url_or_id: str) -> str:
       https://www.notion.so/abc123def456
       abc123def456 (raw ID, with or without dashes)
     """
-    import re
     url_or_id = url_or_id.strip()
 
     # If it looks like a URL, extract the last 32 hex chars
@@ -345,8 +812,12 @@ def update_venue_outreach(
     notion: NotionClient,
     page_id: str,
     enriched: EnrichedVenue,
+    today: str | None = None,
 ) -> None:
-    """Update a venue's Notion page with enriched contact data and email draft."""
+    """Update a venue's Notion page with enriched contact data and email draft.
+
+    ``today`` is the ISO date to record as Outreach Date (default: today_iso()).
+    """
     properties: dict = {}
 
     # Update contact info (only if enriched data is better than original)
@@ -367,19 +838,24 @@ def update_venue_outreach(
     if enriched.booking_form_url:
         properties["Booking Form URL"] = {"url": enriched.booking_form_url}
 
-    # Email draft (truncate to 2000 chars for Notion rich_text limit)
+    # Email draft (truncate to 2000 chars for Notion rich_text limit) —
+    # slice once, and only when the draft is actually over the limit
     if enriched.email_body:
-        email_text = enriched.email_body[:2000]
-        if enriched.email_subject:
-            email_text = f"Subject: {enriched.email_subject}\n\n{email_text}"
-            email_text = email_text[:2000]
+        prefix = f"Subject: {enriched.email_subject}\n\n" if enriched.email_subject else ""
+        body = enriched.email_body
+        budget = NOTION_RICH_TEXT_LIMIT - len(prefix)
+        if len(body) > budget:
+            body = body[:max(budget, 0)]
+        email_text = prefix + body
+        if budget < 0:
+            email_text = email_text[:NOTION_RICH_TEXT_LIMIT]
         properties["Outreach Email"] = {
             "rich_text": [{"text": {"content": email_text}}]
         }
 
     # Outreach date
     properties["Outreach Date"] = {
-        "date": {"start": date.today().isoformat()}
+        "date": {"start": today or today_iso()}
     }
 
     # Contact method (prioritize: email > form > phone > website)
@@ -394,42 +870,31 @@ def update_venue_outreach(
     properties["Contact Method"] = {"select": {"name": method}}
 
     # Advance status to Ready for Outreach
-    properties["Status"] = {"select": {"name": "Ready for Outreach"}}
+    properties["Status"] = {"select": {"name": VenueStatus.READY_FOR_OUTREACH.value}}
 
     if properties:
         try:
-            notion.pages.update(page_id=page_id, properties=properties)
+            with PageUpdater(notion, page_id) as page:
+                page.properties.update(properties)
             print(f"      \U0001f4dd Updated in Notion: {', '.join(properties.keys())}")
         except Exception as e:
             print(f"      \u26a0\ufe0f  Failed to update Notion: {e}")
 
 
-def update_date_last_checked(notion: NotionClient, page_id: str) -> None:
-    """Set the Date Last Checked property to today."""
-    try:
-        notion.pages.update(
-            page_id=page_id,
-            properties={
-                "Date Last Checked": {
-                    "date": {"start": date.today().isoformat()}
-                }
-            },
-        )
-    except Exception as e:
-        # Silently skip if property doesn't exist yet
-        pass
+def update_date_last_checked(notion: NotionClient, page_id: str, today: str | None = None) -> None:
+    """Set the Date Last Checked property to today (or the given ISO date)."""
+    # Optional property — silently skipped if it doesn't exist yet
+    with PageUpdater(notion, page_id) as page:
+        page.stamp_last_checked(today)
 
 
-def advance_venue_status(notion: NotionClient, page_id: str, new_status: str) -> None:
+def advance_venue_status(notion: NotionClient, page_id: str, new_status: VenueStatus | str) -> None:
     """Set a venue's status to a new value."""
-    valid = {"New", "Ready for Outreach", "Contacted", "Responded", "Confirmed", "Rejected", "Archived"}
-    if new_status not in valid:
-        print(f"  \u26a0\ufe0f  Invalid status '{new_status}'. Must be one of: {valid}")
+    if new_status not in _VALID_STATUSES:
+        print(f"  \u26a0\ufe0f  Invalid status '{new_status}'. Must be one of: {', '.join(s.value for s in VenueStatus)}")
         return
     try:
-        notion.pages.update(
-            page_id=page_id,
-            properties={"Status": {"select": {"name": new_status}}},
-        )
+        with PageUpdater(notion, page_id) as page:
+            page.set_status(new_status)
     except Exception as e:
         print(f"  \u274c Failed to update status: {e}")
@@ -8,21 +8,27 @@ a linked Team Project page or manually provided brief.
 
 from __future__ import annotations
 
-import json
-import re
-import time
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
 
 import anthropic
-
-from event_research.config import Config
-from event_research.health_check import _extract_property_text
-from event_research.models import EnrichedVenue, OutreachResult
+import orjson
+from pydantic import BaseModel
+
+from event_research import llm_cache
+from event_research.agent import CONTINUE_STOP_REASONS, get_anthropic_client
+from event_research.config import HAIKU_MODEL, Config
+from event_research.health_check import _extract_property_texts
+from event_research.models import EmailOutput, EnrichedVenue, EnrichmentOutput, OutreachResult
+from event_research.ratelimit import RateLimiter
 from event_research.templates.outreach import (
     ENRICHMENT_SYSTEM_PROMPT,
     EMAIL_SYSTEM_PROMPT,
-    EVENT_DETAILS_EXTRACT_PROMPT,
     build_enrichment_prompt,
     build_email_prompt,
+    build_extraction_prompt,
 )
 
 
@@ -34,14 +40,69 @@ WEB_SEARCH_TOOL = {
     "max_uses": 10,
 }
 
-MAX_ENRICHMENT_TURNS = 8
-HAIKU_MODEL = "claude-haiku-4-20250414"
+OUTREACH_CONCURRENCY = 4  # venues run through the pipeline at once
+ESCALATION_TURNS = 3  # the escalated model starts from the first model's searches
+MAX_PAGE_TOKENS = 3000  # project page text sent for event-detail extraction
+CHARS_PER_TOKEN = 4  # same rough estimate the rate limiter uses
+# Part of every llm_cache key — bump whenever a prompt template changes so
+# cached responses from the old wording are ignored
+PROMPT_VERSION = "v3"
+EVENT_DETAILS_SYSTEM = "You extract structured data from text. Return only JSON."
+
+# Client-side pacing shared by all outreach threads — requests wait for
+# capacity up front instead of sleeping 30-90s after a 429
+OUTREACH_RPM = 50
+OUTREACH_TPM = 80_000
+_rate_limiter = RateLimiter(rpm=OUTREACH_RPM, tpm=OUTREACH_TPM)
+
+# Claude calls currently running, by llm_cache key — an identical prompt in
+# the same (or an overlapping) batch waits for the running call instead of
+# sending its own
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+T = TypeVar("T")
+
+
+def _single_flight(key: str, fn: Callable[[], T]) -> T:
+    """Run ``fn`` once per ``key`` at a time; concurrent callers share its result."""
+    with _inflight_lock:
+        pending = _inflight.get(key)
+        owner = pending is None
+        if owner:
+            pending = _inflight[key] = Future()
+    if not owner:
+        return pending.result()
+
+    try:
+        result = fn()
+        pending.set_result(result)
+        return result
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
 
 
-# ---- Retry helper (same pattern as agent.py) ----
+def _output_tool(name: str, description: str, schema: type[BaseModel]) -> dict:
+    """A client tool whose input is the structured answer — Claude fills the schema, we never call it."""
+    return {"name": name, "description": description, "input_schema": schema.model_json_schema()}
 
-def _call_with_retry(client, model, system, messages, tools=None, max_tokens=4000, max_retries=3):
-    """Call the API with automatic retry on rate limit errors."""
+
+ENRICHMENT_TOOL = _output_tool(
+    "return_enrichment", "Record the contact information found for the venue.", EnrichmentOutput,
+)
+EMAIL_TOOL = _output_tool("return_email", "Return the drafted outreach email.", EmailOutput)
+
+
+# ---- Retry helper (same pattern as health_check.py) ----
+
+def _call_with_retry(
+    client, model, system, messages, tools=None, max_tokens=4000, max_retries=3, tool_choice=None,
+):
+    """messages.create gated by the shared rate limiter; 429s back the limiter off and retry."""
     kwargs = {
         "model": model,
         "max_tokens": max_tokens,
@@ -50,16 +111,20 @@ def _call_with_retry(client, model, system, messages, tools=None, max_tokens=400
     }
     if tools:
         kwargs["tools"] = tools
+    if tool_choice:
+        kwargs["tool_choice"] = tool_choice
 
-    for attempt in range(max_retries):
+    # Rough cost: ~4 chars per input token plus the full output budget
+    estimate = (len(str(system)) + sum(len(str(m["content"])) for m in messages)) // 4 + max_tokens
+    for attempt in range(max_retries + 1):
+        _rate_limiter.acquire(estimate)
         try:
             return client.messages.create(**kwargs)
         except anthropic.RateLimitError:
-            wait = 30 * (attempt + 1)
-            print(f"   \u23f3 Rate limited \u2014 waiting {wait}s before retry ({attempt + 1}/{max_retries})...")
-            time.sleep(wait)
-    # Final attempt without catching
-    return client.messages.create(**kwargs)
+            _rate_limiter.backoff()
+            if attempt == max_retries:
+                raise
+            print(f"   \u23f3 Rate limited \u2014 slowing down before retry ({attempt + 1}/{max_retries})...")
 
 
 # ---- JSON extraction (same pattern as agent.py) ----
@@ -68,8 +133,8 @@ def _extract_json(text: str) -> dict | None:
     """Try multiple strategies to extract JSON from the response text."""
     # Strategy 1: Direct parse
     try:
-        return json.loads(text.strip())
-    except json.JSONDecodeError:
+        return orjson.loads(text.strip())
+    except orjson.JSONDecodeError:
         pass
 
     # Strategy 2: Remove markdown code fences
@@ -78,8 +143,8 @@ def _extract_json(text: str) -> dict | None:
         lines = cleaned.split("\n")
         lines = [l for l in lines if not l.strip().startswith("```")]
         try:
-            return json.loads("\n".join(lines))
-        except json.JSONDecodeError:
+            return orjson.loads("\n".join(lines))
+        except orjson.JSONDecodeError:
             pass
 
     # Strategy 3: Find the outermost JSON object
@@ -87,16 +152,28 @@ def _extract_json(text: str) -> dict | None:
     end = text.rfind("}") + 1
     if start >= 0 and end > start:
         try:
-            return json.loads(text[start:end])
-        except json.JSONDecodeError:
+            return orjson.loads(text[start:end])
+        except orjson.JSONDecodeError:
             pass
 
     return None
 
 
-def _strip_citations(text: str) -> str:
-    """Remove <cite index='...'>...</cite> tags, keeping the inner text."""
-    return re.sub(r'<cite[^>]*>(.*?)</cite>', r'\1', text, flags=re.DOTALL)
+def _tool_input(response, tool: dict) -> dict | None:
+    """The input Claude passed to ``tool`` in this response, if it called it."""
+    for block in response.content:
+        if block.type == "tool_use" and block.name == tool["name"]:
+            return block.input
+    return None
+
+
+def _has_hits(search_result) -> bool:
+    """True if a web_search_tool_result block has results (not an error or empty list)."""
+    return isinstance(search_result.content, list) and bool(search_result.content)
+
+
+def _forced(tool: dict) -> dict:
+    return {"type": "tool", "name": tool["name"]}
 
 
 # ---- Contact Enrichment ----
@@ -107,6 +184,7 @@ def enrich_venue_contact(
     city: str,
     website: str | None,
     config: Config,
+    use_cache: bool = True,
 ) -> dict:
     """Enrich contact data for a single venue using web search.
 
@@ -114,53 +192,59 @@ def enrich_venue_contact(
       - contact_name, contact_title, email, phone
       - private_events_url, booking_form_url
       - enrichment_notes, confidence
+
+    Runs on config.enrichment_model; a low-confidence answer is retried on
+    config.escalate_model, continuing from the searches already made.
+    Parsed results are kept in llm_cache; ``use_cache=False`` forces a fresh search.
     """
-    client = anthropic.Anthropic(api_key=config.anthropic_api_key)
     prompt = build_enrichment_prompt(venue_name, address, city, website)
+    key = llm_cache.cache_key(
+        config.enrichment_model, config.escalate_model, PROMPT_VERSION, ENRICHMENT_SYSTEM_PROMPT, prompt,
+    )
+    if use_cache and (cached := llm_cache.get(key)) is not None:
+        return cached
 
-    messages = [{"role": "user", "content": prompt}]
-
-    try:
-        response = _call_with_retry(
-            client, config.model, ENRICHMENT_SYSTEM_PROMPT,
-            messages, tools=[WEB_SEARCH_TOOL], max_tokens=4000,
-        )
-
-        # Agentic loop for web search (same pattern as health_check.py)
-        for _ in range(MAX_ENRICHMENT_TURNS):
-            if response.stop_reason == "end_turn":
-                break
-            messages.append({"role": "assistant", "content": response.content})
-            tool_results = [b for b in response.content if b.type == "web_search_tool_result"]
-            if tool_results:
-                messages.append({"role": "user", "content": tool_results})
-                response = _call_with_retry(
-                    client, config.model, ENRICHMENT_SYSTEM_PROMPT,
-                    messages, tools=[WEB_SEARCH_TOOL], max_tokens=4000,
-                )
-            else:
-                break
-
-        # Extract text
-        text = ""
-        for block in response.content:
-            if block.type == "text":
-                text += block.text
+    return _single_flight(key, lambda: _enrich_uncached(venue_name, prompt, key, config))
 
-        text = _strip_citations(text)
-        data = _extract_json(text)
 
-        if data:
-            # Clean up any citation artifacts in values
-            for key in data:
-                if isinstance(data[key], str):
-                    data[key] = _strip_citations(data[key])
-            return data
+def _enrich_uncached(venue_name: str, prompt: str, key: str, config: Config) -> dict:
+    """The enrichment searches themselves; failures come back as a low-confidence dict."""
+    client = get_anthropic_client(config.anthropic_api_key)
+    messages = [{"role": "user", "content": prompt}]
 
-        return {
-            "enrichment_notes": f"Could not parse enrichment response: {text[:300]}",
-            "confidence": "low",
-        }
+    try:
+        data = _run_enrichment(client, config.enrichment_model, messages, config.max_enrichment_turns)
+        if data is not None:
+            enrichment = EnrichmentOutput.model_validate(data).model_dump()
+        else:
+            # Even the forced call came back without a return_enrichment block
+            # (e.g. it stopped on max_tokens) — escalation may still get one
+            enrichment = EnrichmentOutput(
+                enrichment_notes="Searches completed but no structured contact details were returned.",
+                confidence="low",
+            ).model_dump()
+
+        if (
+            enrichment["confidence"] == "low"
+            and config.escalate_model
+            and config.escalate_model != config.enrichment_model
+        ):
+            print(f"   \u2b06\ufe0f  {venue_name}: low confidence \u2014 retrying on {config.escalate_model}")
+            try:
+                escalated = _run_enrichment(client, config.escalate_model, messages, ESCALATION_TURNS)
+                if escalated is not None:
+                    data = escalated
+                    enrichment = EnrichmentOutput.model_validate(escalated).model_dump()
+                else:
+                    print(f"   \u26a0\ufe0f  {venue_name}: escalation returned no structured result")
+            except Exception as e:
+                # Keep the first model's answer rather than losing it
+                print(f"   \u26a0\ufe0f  {venue_name}: escalation failed: {e}")
+
+        # Only real answers are cached — a missing one is retried next run
+        if data is not None:
+            llm_cache.set(key, enrichment)
+        return enrichment
 
     except Exception as e:
         return {
@@ -169,34 +253,106 @@ def enrich_venue_contact(
         }
 
 
+def _run_enrichment(client, model: str, messages: list, max_turns: int) -> dict | None:
+    """Search loop for one model; returns its return_enrichment input.
+
+    ``messages`` is extended with each completed search round, so a
+    second model can pick up where this one stopped.
+    """
+    tools = [WEB_SEARCH_TOOL, ENRICHMENT_TOOL]
+
+    # Agentic loop for web search (same pattern as health_check.py) —
+    # ends when Claude reports through return_enrichment, stops searching,
+    # or its searches come back empty (more turns won't find anything new)
+    data = None
+    # At least one turn, so there's always a response for the forced call below
+    for _ in range(max(1, max_turns)):
+        response = _call_with_retry(
+            client, model, ENRICHMENT_SYSTEM_PROMPT,
+            messages, tools=tools, max_tokens=4000,
+        )
+        # One pass over the content finds both the answer and the search results
+        tool_results = []
+        for block in response.content:
+            if block.type == "web_search_tool_result":
+                tool_results.append(block)
+            elif block.type == "tool_use" and block.name == ENRICHMENT_TOOL["name"]:
+                data = block.input
+        if data is not None or response.stop_reason not in CONTINUE_STOP_REASONS:
+            break
+        if not any(_has_hits(b) for b in tool_results):
+            break
+        messages.append({"role": "assistant", "content": response.content})
+        messages.append({"role": "user", "content": tool_results})
+
+    if data is None:
+        # Claude wrapped up in prose — one forced call turns its findings into the
+        # schema (on a copy, so the shared history stays open for more searching)
+        response = _call_with_retry(
+            client, model, ENRICHMENT_SYSTEM_PROMPT,
+            messages + [
+                {"role": "assistant", "content": response.content},
+                {"role": "user", "content": "Record what you found with the return_enrichment tool."},
+            ],
+            tools=tools, max_tokens=1000, tool_choice=_forced(ENRICHMENT_TOOL),
+        )
+        data = _tool_input(response, ENRICHMENT_TOOL)
+    return data
+
+
 # ---- Event Details Extraction ----
 
-def extract_event_details_from_page(page_content: str, config: Config) -> dict | None:
+def extract_event_details_from_page(page_content: str, config: Config, use_cache: bool = True) -> dict | None:
     """Extract event details from free-form Notion page content using Claude.
 
     Returns a dict with keys like event_type, date, guest_count, budget,
     vibe, audience, requirements. Returns None if extraction fails.
     """
-    client = anthropic.Anthropic(api_key=config.anthropic_api_key)
+    prompt = build_extraction_prompt(_truncate_to_tokens(page_content, MAX_PAGE_TOKENS))
+    key = llm_cache.cache_key(HAIKU_MODEL, PROMPT_VERSION, EVENT_DETAILS_SYSTEM, prompt)
+    if use_cache and (cached := llm_cache.get(key)) is not None:
+        return cached
+    return _single_flight(key, lambda: _extract_uncached(prompt, key, config))
 
-    prompt = EVENT_DETAILS_EXTRACT_PROMPT + page_content[:4000]  # Limit content length
+
+def _extract_uncached(prompt: str, key: str, config: Config) -> dict | None:
+    client = get_anthropic_client(config.anthropic_api_key)
 
     try:
         response = _call_with_retry(
             client, HAIKU_MODEL,
-            "You extract structured data from text. Return only JSON.",
+            EVENT_DETAILS_SYSTEM,
             [{"role": "user", "content": prompt}],
             max_tokens=1000,
         )
 
         text = response.content[0].text.strip()
-        return _extract_json(text)
+        data = _extract_json(text)
+        if data:
+            llm_cache.set(key, data)
+        return data
 
     except Exception as e:
         print(f"   \u26a0\ufe0f  Failed to extract event details: {e}")
         return None
 
 
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Longest run of whole paragraphs from the start of ``text`` that fits ``max_tokens``.
+
+    Tokens are estimated at CHARS_PER_TOKEN — counting them exactly would
+    cost an API round-trip per page. A first paragraph that alone is over
+    budget is cut at the last word boundary that fits.
+    """
+    budget = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= budget:
+        return text
+    cut = text.rfind("\n\n", 0, budget + 1)
+    if cut <= 0:
+        cut = text.rfind(" ", 0, budget + 1)
+    return text[:cut if cut > 0 else budget].rstrip()
+
+
 # ---- Email Drafting ----
 
 def draft_outreach_email(
@@ -206,25 +362,34 @@ def draft_outreach_email(
     event_details: dict,
     private_events_url: str | None,
     config: Config,
+    use_cache: bool = True,
 ) -> dict | None:
     """Draft a personalized outreach email for a venue.
 
     Returns a dict with 'subject' and 'body' keys, or None on failure.
     """
-    client = anthropic.Anthropic(api_key=config.anthropic_api_key)
     prompt = build_email_prompt(
         venue_name, contact_name, highlights, event_details, private_events_url,
     )
+    key = llm_cache.cache_key(HAIKU_MODEL, PROMPT_VERSION, EMAIL_SYSTEM_PROMPT, prompt)
+    if use_cache and (cached := llm_cache.get(key)) is not None:
+        return cached
+    return _single_flight(key, lambda: _draft_uncached(prompt, key, config))
+
+
+def _draft_uncached(prompt: str, key: str, config: Config) -> dict | None:
+    client = get_anthropic_client(config.anthropic_api_key)
 
     try:
         response = _call_with_retry(
             client, HAIKU_MODEL, EMAIL_SYSTEM_PROMPT,
             [{"role": "user", "content": prompt}],
-            max_tokens=2000,
+            tools=[EMAIL_TOOL], max_tokens=2000, tool_choice=_forced(EMAIL_TOOL),
         )
 
-        text = response.content[0].text.strip()
-        return _extract_json(text)
+        email = EmailOutput.model_validate(_tool_input(response, EMAIL_TOOL)).model_dump()
+        llm_cache.set(key, email)
+        return email
 
     except Exception as e:
         print(f"   \u26a0\ufe0f  Failed to draft email: {e}")
@@ -239,6 +404,7 @@ def run_outreach_for_venue(
     event_details: dict | None = None,
     enrich_only: bool = False,
     project_content: str | None = None,
+    use_cache: bool = True,
 ) -> EnrichedVenue:
     """Run the full outreach pipeline for a single venue.
 
@@ -248,6 +414,9 @@ def run_outreach_for_venue(
     4. Draft outreach email (unless enrich_only)
     5. Return EnrichedVenue with all data
 
+    Steps 2 and 3 don't depend on each other, so the extraction runs on a
+    helper thread while the enrichment search is in flight.
+
     Args:
         page: Notion page dict for the venue
         config: App config
@@ -255,17 +424,62 @@ def run_outreach_for_venue(
         enrich_only: Skip email drafting if True
         project_content: Content from linked Team Project page (for detail extraction)
     """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        details = _event_details_future(pool, event_details, enrich_only, project_content, config, use_cache)
+        return _run_venue(page, config, details, enrich_only, use_cache)
+
+
+def _event_details_future(
+    pool: ThreadPoolExecutor,
+    event_details: dict | None,
+    enrich_only: bool,
+    project_content: str | None,
+    config: Config,
+    use_cache: bool,
+) -> Future:
+    """The event details the email drafts will use, as a future.
+
+    Given details (or nothing to extract from, or no drafting) resolve
+    immediately; otherwise extraction is submitted to ``pool`` and the
+    future reports its outcome when it lands.
+    """
+    if event_details or enrich_only or not project_content:
+        future = Future()
+        future.set_result(event_details)
+        return future
+
+    future = pool.submit(extract_event_details_from_page, project_content, config, use_cache=use_cache)
+
+    def report(f: Future) -> None:
+        if f.exception() is None and f.result():
+            print("   \U0001f4cb Extracted event details from project page")
+        else:
+            print("   \U0001f4cb Could not extract event details from project page")
+
+    future.add_done_callback(report)
+    return future
+
+
+# Page properties read for every venue, in the order _run_venue unpacks them
+_VENUE_PROPERTIES = (
+    "Name", "Address", "City", "Website", "Phone", "Email",
+    "Contact Name", "Highlights", "Price Range", "Neighborhood",
+)
+
+
+def _run_venue(
+    page: dict,
+    config: Config,
+    event_details: Future,
+    enrich_only: bool,
+    use_cache: bool,
+) -> EnrichedVenue:
+    """Enrich one venue and draft its email; ``event_details`` is only awaited before drafting."""
     # Extract existing data from Notion page
-    name = _extract_property_text(page, "Name")
-    address = _extract_property_text(page, "Address")
-    city = _extract_property_text(page, "City")
-    website = _extract_property_text(page, "Website")
-    phone = _extract_property_text(page, "Phone")
-    email = _extract_property_text(page, "Email")
-    contact_name = _extract_property_text(page, "Contact Name")
-    highlights = _extract_property_text(page, "Highlights")
-    price_range = _extract_property_text(page, "Price Range")
-    neighborhood = _extract_property_text(page, "Neighborhood")
+    (
+        name, address, city, website, phone, email,
+        contact_name, highlights, price_range, neighborhood,
+    ) = _extract_property_texts(page, _VENUE_PROPERTIES)
     page_id = page["id"]
     notion_url = page.get("url", "")
 
@@ -284,9 +498,10 @@ def run_outreach_for_venue(
         neighborhood=neighborhood or None,
     )
 
+    # Venues run concurrently, so every progress line names its venue and
+    # is printed whole
     # Step 1: Enrich contacts
-    print(f"   \U0001f50d Enriching contacts...", end=" ", flush=True)
-    enrichment = enrich_venue_contact(name, address, city, website, config)
+    enrichment = enrich_venue_contact(name, address, city, website, config, use_cache=use_cache)
 
     result.enriched_contact_name = enrichment.get("contact_name")
     result.enriched_contact_title = enrichment.get("contact_title")
@@ -309,23 +524,15 @@ def run_outreach_for_venue(
         new_info.append("events page")
 
     if new_info:
-        print(f"Found: {', '.join(new_info)}")
+        print(f"   \U0001f50d {name}: found {', '.join(new_info)}")
     else:
-        print("No new info found")
-
-    # Step 2: Extract event details from project content if needed
-    if not event_details and project_content:
-        print(f"   \U0001f4cb Extracting event details from project page...", end=" ", flush=True)
-        event_details = extract_event_details_from_page(project_content, config)
-        if event_details:
-            print("Done")
-        else:
-            print("Could not extract details")
-
-    # Step 3: Draft email (if we have event details and not enrich_only)
-    if not enrich_only and event_details:
-        print(f"   \u2709\ufe0f  Drafting outreach email...", end=" ", flush=True)
+        print(f"   \U0001f50d {name}: no new contact info found")
 
+    # Step 2: Draft email (if we have event details and not enrich_only)
+    if enrich_only:
+        return result
+    details = event_details.result()
+    if details:
         # Use best available contact name
         best_contact = (
             result.enriched_contact_name
@@ -336,17 +543,18 @@ def run_outreach_for_venue(
             venue_name=name,
             contact_name=best_contact,
             highlights=highlights,
-            event_details=event_details,
+            event_details=details,
             private_events_url=result.private_events_url,
             config=config,
+            use_cache=use_cache,
         )
 
         if email_data:
             result.email_subject = email_data.get("subject")
             result.email_body = email_data.get("body")
-            print("Done")
+            print(f"   \u2709\ufe0f  {name}: outreach email drafted")
         else:
-            print("Failed")
+            print(f"   \u2709\ufe0f  {name}: email draft failed")
 
     return result
 
@@ -357,45 +565,45 @@ def run_outreach_batch(
     event_details: dict | None = None,
     enrich_only: bool = False,
     project_content: str | None = None,
+    use_cache: bool = True,
 ) -> OutreachResult:
     """Run outreach pipeline on a batch of venues.
 
+    Up to OUTREACH_CONCURRENCY venues are enriched / drafted at once;
+    results keep the order of ``pages``. Event details are extracted from
+    ``project_content`` once for the whole batch, alongside the enrichments.
+
     Args:
         pages: List of Notion page dicts
         config: App config
         event_details: Event details dict (used for all venues)
         enrich_only: Skip email drafting
         project_content: Content from linked Team Project page
+        use_cache: Reuse cached Claude responses for identical prompts
     """
     total = len(pages)
-    enriched_venues = []
     enriched_count = 0
     drafted_count = 0
 
     print(f"\n\U0001f4e7 Running outreach on {total} venue(s)...\n")
 
-    for i, page in enumerate(pages, 1):
-        name = _extract_property_text(page, "Name")
-        print(f"  [{i}/{total}] {name}")
-
-        venue = run_outreach_for_venue(
-            page, config,
-            event_details=event_details,
-            enrich_only=enrich_only,
-            project_content=project_content,
+    with ThreadPoolExecutor(max_workers=1) as details_pool, \
+            ThreadPoolExecutor(max_workers=OUTREACH_CONCURRENCY, thread_name_prefix="outreach") as pool:
+        details = _event_details_future(
+            details_pool, event_details, enrich_only, project_content, config, use_cache,
         )
-        enriched_venues.append(venue)
+        enriched_venues = list(pool.map(
+            lambda page: _run_venue(page, config, details, enrich_only, use_cache), pages,
+        ))
+        event_details = details.result()
 
-        # Count results
+    # Count results
+    for venue in enriched_venues:
         if (venue.enriched_email or venue.enriched_contact_name or venue.enriched_phone):
             enriched_count += 1
         if venue.email_body:
             drafted_count += 1
 
-        # Rate limit courtesy
-        if i < total:
-            time.sleep(2)
-
     # Summary
     print(f"\n\U0001f4ca Outreach Summary:")
     print(f"   \U0001f50d Enriched: {enriched_count}/{total}")
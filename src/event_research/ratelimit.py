@@ -0,0 +1,59 @@
+"""Client-side rate limiting for Anthropic calls.
+
+A token bucket over requests/minute and tokens/minute, shared by the worker
+threads that fan out API calls. Waiting here up front is cheaper than
+sending a request that comes back as a 429.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+POLL_INTERVAL = 0.05  # seconds between capacity checks while waiting
+RECOVERY_SECONDS = 60  # time for the refill rate to recover fully after a 429
+
+
+class RateLimiter:
+    """Thread-safe RPM/TPM token bucket with AIMD backoff.
+
+    ``acquire(tokens)`` blocks until there's capacity for one request of
+    roughly ``tokens`` tokens. ``backoff()`` (call it on a 429) halves the
+    refill rate, which then climbs back linearly over RECOVERY_SECONDS.
+
+    ``burst`` caps how many requests can go out back to back before the
+    refill rate takes over; it defaults to a full minute's worth (``rpm``).
+    """
+
+    def __init__(self, rpm: float, tpm: float, burst: float | None = None):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.burst = float(rpm if burst is None else burst)
+        self._requests = self.burst
+        self._tokens = float(tpm)
+        self._scale = 1.0  # fraction of the nominal refill rate currently allowed
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last
+        self._last = now
+        self._requests = min(self.burst, self._requests + elapsed * self.rpm / 60 * self._scale)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60 * self._scale)
+        self._scale = min(1.0, self._scale + elapsed / RECOVERY_SECONDS)
+
+    def acquire(self, tokens: int) -> None:
+        tokens = min(tokens, self.tpm)  # an oversized estimate must not wait forever
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+            time.sleep(POLL_INTERVAL)
+
+    def backoff(self) -> None:
+        with self._lock:
+            self._scale = max(0.1, self._scale / 2)
+            self._requests = 0.0
@@ -6,7 +6,23 @@ via the Slack API (through n8n or directly).
 
 from __future__ import annotations
 
-from event_research.models import OutreachResult, ResearchResult, Venue
+from event_research.models import EnrichedVenue, OutreachResult, ResearchResult, Venue
+
+_CONFIDENCE_EMOJI = {"high": "🟢", "medium": "🟡", "low": "🔴"}
+_DIVIDER = {"type": "divider"}  # identical in every message, so shared
+
+
+def _section(text: str) -> dict:
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+def _context(text: str) -> dict:
+    return {"type": "context", "elements": [{"type": "mrkdwn", "text": text}]}
+
+
+def _joined(*parts: str | None, sep: str = " · ") -> str:
+    """Join the non-empty parts — each optional field is either its text or None."""
+    return sep.join(p for p in parts if p)
 
 
 def format_results_for_slack(result: ResearchResult) -> list[dict]:
@@ -38,42 +54,21 @@ def format_results_for_slack(result: ResearchResult) -> list[dict]:
         summary_parts.append(f"🎯 {brief.audience}")
 
     if summary_parts:
-        blocks.append({
-            "type": "context",
-            "elements": [{"type": "mrkdwn", "text": " · ".join(summary_parts)}],
-        })
+        blocks.append(_context(" · ".join(summary_parts)))
 
-    blocks.append({"type": "divider"})
+    blocks.append(_DIVIDER)
 
     # Research notes
     if result.research_notes:
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*Research Notes:* {result.research_notes[:500]}",
-            },
-        })
-        blocks.append({"type": "divider"})
+        blocks.append(_section(f"*Research Notes:* {result.research_notes[:500]}"))
+        blocks.append(_DIVIDER)
 
     # Venues
     if not result.venues:
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "No venues found. Try broadening your search criteria.",
-            },
-        })
+        blocks.append(_section("No venues found. Try broadening your search criteria."))
         return blocks
 
-    blocks.append({
-        "type": "section",
-        "text": {
-            "type": "mrkdwn",
-            "text": f"*Found {len(result.venues)} venue(s):*",
-        },
-    })
+    blocks.append(_section(f"*Found {len(result.venues)} venue(s):*"))
 
     for i, venue in enumerate(result.venues, 1):
         blocks.extend(_format_venue_block(i, venue))
@@ -84,87 +79,45 @@ def format_results_for_slack(result: ResearchResult) -> list[dict]:
 def _format_venue_block(index: int, venue: Venue) -> list[dict]:
     """Format a single venue as Slack blocks."""
 
-    blocks = []
-
     # Venue name with link
-    name_text = f"*{index}. {venue.name}*"
     if venue.website:
         name_text = f"*{index}. <{venue.website}|{venue.name}>*"
-
-    # Build details text
-    details = []
-    details.append(f"📍 {venue.address}")
-    if venue.venue_type:
-        details.append(f"🏠 {venue.venue_type}")
-    if venue.price_range:
-        details.append(f"💰 {venue.price_range}")
-    if venue.estimated_cost:
-        details.append(f"💵 Est: {venue.estimated_cost}")
-    if venue.capacity_min or venue.capacity_max:
-        cap = f"👥 {venue.capacity_min or '?'}–{venue.capacity_max or '?'} guests"
-        details.append(cap)
-
-    # Features line
-    features = []
-    if venue.private_space:
-        features.append("🔒 Private")
-    if venue.av_available:
-        features.append("🎥 AV")
-    if venue.outdoor_space:
-        features.append("🌿 Outdoor")
-    if venue.cuisine_or_style:
-        features.append(f"🍽️ {venue.cuisine_or_style}")
-    if features:
-        details.append(" · ".join(features))
-
-    blocks.append({
-        "type": "section",
-        "text": {
-            "type": "mrkdwn",
-            "text": f"{name_text}\n{chr(10).join(details)}",
-        },
-    })
-
-    # Highlights
+    else:
+        name_text = f"*{index}. {venue.name}*"
+
+    features = _joined(
+        "🔒 Private" if venue.private_space else None,
+        "🎥 AV" if venue.av_available else None,
+        "🌿 Outdoor" if venue.outdoor_space else None,
+        f"🍽️ {venue.cuisine_or_style}" if venue.cuisine_or_style else None,
+    )
+    capacity = (
+        f"👥 {venue.capacity_min or '?'}–{venue.capacity_max or '?'} guests"
+        if venue.capacity_min or venue.capacity_max else None
+    )
+    details = _joined(
+        f"📍 {venue.address}",
+        f"🏠 {venue.venue_type}" if venue.venue_type else None,
+        f"💰 {venue.price_range}" if venue.price_range else None,
+        f"💵 Est: {venue.estimated_cost}" if venue.estimated_cost else None,
+        capacity,
+        features,
+        sep="\n",
+    )
+    contact = _joined(
+        f"📞 {venue.phone}" if venue.phone else None,
+        f"📧 {venue.email}" if venue.email else None,
+        f"👤 {venue.contact_name}" if venue.contact_name else None,
+    )
+    confidence_emoji = _CONFIDENCE_EMOJI.get(venue.confidence, "⚪")
+
+    blocks = [_section(f"{name_text}\n{details}")]
     if venue.highlights:
-        blocks.append({
-            "type": "context",
-            "elements": [{
-                "type": "mrkdwn",
-                "text": f"💡 _{venue.highlights}_",
-            }],
-        })
-
-    # Contact info
-    contact_parts = []
-    if venue.phone:
-        contact_parts.append(f"📞 {venue.phone}")
-    if venue.email:
-        contact_parts.append(f"📧 {venue.email}")
-    if venue.contact_name:
-        contact_parts.append(f"👤 {venue.contact_name}")
-
-    if contact_parts:
-        blocks.append({
-            "type": "context",
-            "elements": [{
-                "type": "mrkdwn",
-                "text": " · ".join(contact_parts),
-            }],
-        })
-
-    # Confidence badge
-    confidence_emoji = {"high": "🟢", "medium": "🟡", "low": "🔴"}.get(venue.confidence, "⚪")
-    blocks.append({
-        "type": "context",
-        "elements": [{
-            "type": "mrkdwn",
-            "text": f"{confidence_emoji} Confidence: {venue.confidence}",
-        }],
-    })
-
-    blocks.append({"type": "divider"})
-
+        blocks.append(_context(f"💡 _{venue.highlights}_"))
+    if contact:
+        blocks.append(_context(contact))
+    blocks.append(_context(f"{confidence_emoji} Confidence: {venue.confidence}"))
+    blocks.append(_DIVIDER)
     return blocks
 
 
@@ -177,13 +130,7 @@ def format_outreach_for_slack(result: OutreachResult) -> list[dict]:
     blocks = []
 
     if not result.venues:
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "No venues processed for outreach.",
-            },
-        })
+        blocks.append(_section("No venues processed for outreach."))
         return blocks
 
     # Header
@@ -199,52 +146,32 @@ def format_outreach_for_slack(result: OutreachResult) -> list[dict]:
     stats = f"Enriched: {result.total_enriched}/{result.total_processed}"
     if result.total_emails_drafted > 0:
         stats += f" | Emails drafted: {result.total_emails_drafted}"
-    blocks.append({
-        "type": "context",
-        "elements": [{"type": "mrkdwn", "text": stats}],
-    })
+    blocks.append(_context(stats))
 
-    blocks.append({"type": "divider"})
+    blocks.append(_DIVIDER)
 
     # Per-venue: quick-glance info (numbered so user can respond with a number)
-    for i, v in enumerate(result.venues, 1):
-        # Venue name linked to website, with number prefix
-        name_text = f"*{i}. {v.name}*"
-        if v.website:
-            name_text = f"*{i}. <{v.website}|{v.name}>*"
-
-        # Quick details
-        details = []
-        if v.address:
-            details.append(f"{v.address}")
-        if v.price_range:
-            details.append(f"{v.price_range}")
-
-        # Contact info
-        contact = v.enriched_contact_name or v.original_contact_name
-        email = v.enriched_email or v.original_email
-        phone = v.enriched_phone or v.original_phone
-        contact_parts = []
-        if contact:
-            contact_parts.append(contact)
-        if email:
-            contact_parts.append(email)
-        elif phone:
-            contact_parts.append(phone)
-
-        line = name_text
-        if details:
-            line += f"\n{' · '.join(details)}"
-        if contact_parts:
-            line += f"\n{' · '.join(contact_parts)}"
-
-        # Notion link
-        if v.notion_url:
-            line += f"\n<{v.notion_url}|View in Notion>"
-
-        blocks.append({
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": line},
-        })
-
+    blocks.extend([_outreach_venue_section(i, v) for i, v in enumerate(result.venues, 1)])
     return blocks
+
+
+def _outreach_venue_section(index: int, v: EnrichedVenue) -> dict:
+    """One section block per venue: linked name, location / price, contact, Notion link."""
+    # Venue name linked to website, with number prefix
+    if v.website:
+        name_text = f"*{index}. <{v.website}|{v.name}>*"
+    else:
+        name_text = f"*{index}. {v.name}*"
+
+    # Prefer enriched contact info; email wins over phone
+    contact = _joined(
+        v.enriched_contact_name or v.original_contact_name,
+        v.enriched_email or v.original_email or v.enriched_phone or v.original_phone,
+    )
+    return _section(_joined(
+        name_text,
+        _joined(v.address, v.price_range),
+        contact,
+        f"<{v.notion_url}|View in Notion>" if v.notion_url else None,
+        sep="\n",
+    ))
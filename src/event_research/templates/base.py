@@ -4,6 +4,10 @@ Each template tells the agent what to prioritize, what questions to answer,
 and what kind of venues to look for based on the event type.
 """
 
+from __future__ import annotations
+
+import functools
+
 from event_research.models import EventBrief, EventType
 
 # ----- Shared preamble for all event types -----
@@ -121,73 +125,102 @@ AVOID:
 }
 
 
+# Labels for the optional brief lines, in prompt order (unset fields are skipped)
+_BRIEF_LABELS = (
+    "Neighborhood/Area", "Budget", "Guest Count", "Vibe/Atmosphere", "Audience",
+    "Must-Haves", "Keywords/Preferences", "Target Date", "Additional Notes",
+)
+
+_RESEARCH_INSTRUCTIONS_BLOCK = """\
+--- INSTRUCTIONS ---
+Research and recommend up to 8 venues that match the event brief below. \
+For each venue, use the web search tool to find and verify: \
+the venue's website, phone number, email, private event contact, \
+pricing details, capacity, and any relevant details.
+
+After researching, return your results as a JSON object with this exact structure:
+{
+  "venues": [
+    {
+      "name": "Venue Name",
+      "address": "Full street address",
+      "neighborhood": "Neighborhood name",
+      "city": "City",
+      "venue_type": "e.g. restaurant - private dining",
+      "website": "https://...",
+      "phone": "phone number",
+      "email": "events@ or contact email",
+      "contact_name": "Events manager name if found",
+      "price_range": "e.g. $$$, $150-200pp",
+      "estimated_cost": "e.g. $4,500 for 20 guests",
+      "capacity_min": 10,
+      "capacity_max": 40,
+      "private_space": true,
+      "av_available": false,
+      "outdoor_space": true,
+      "cuisine_or_style": "e.g. Modern American, Italian",
+      "best_for": ["dinner", "happy_hour"],
+      "highlights": "1-2 sentence pitch for why this venue fits the brief",
+      "source_url": "URL where you found/verified info",
+      "confidence": "high"
+    }
+  ],
+  "research_notes": "Brief summary of your research process and any caveats"
+}
+
+Return ONLY the JSON object, no other text."""
+
+# Everything in the research prompt that doesn't depend on the brief, joined
+# once at import. It leads the prompt so every brief of a type shares it as
+# a byte-identical prefix, which the agent marks for prompt caching.
+_RESEARCH_INSTRUCTIONS: dict[EventType, str] = {
+    event_type: f"{guidance}\n\n{_RESEARCH_INSTRUCTIONS_BLOCK}"
+    for event_type, guidance in EVENT_TYPE_GUIDANCE.items()
+}
+
+
+def build_research_instructions(event_type: EventType) -> str:
+    """Static guidance + instructions that open the research prompt for an event type."""
+    return _RESEARCH_INSTRUCTIONS[event_type]
+
+
 def build_research_prompt(brief: EventBrief) -> str:
     """Build the full user prompt for the research agent from an EventBrief."""
+    return f"{build_research_instructions(brief.event_type)}\n\n{build_research_brief(brief)}"
 
-    guidance = EVENT_TYPE_GUIDANCE[brief.event_type]
-
-    parts = [
-        guidance,
-        "\n--- EVENT BRIEF ---\n",
-        f"Event Type: {brief.event_type.value}",
-        f"City: {brief.city}",
-    ]
-
-    if brief.neighborhood:
-        parts.append(f"Neighborhood/Area: {brief.neighborhood}")
-    if brief.budget:
-        parts.append(f"Budget: {brief.budget}")
-    if brief.guest_count:
-        parts.append(f"Guest Count: {brief.guest_count}")
-    if brief.vibe:
-        parts.append(f"Vibe/Atmosphere: {brief.vibe}")
-    if brief.audience:
-        parts.append(f"Audience: {brief.audience}")
-    if brief.requirements:
-        parts.append(f"Must-Haves: {', '.join(brief.requirements)}")
-    if brief.keywords:
-        parts.append(f"Keywords/Preferences: {', '.join(brief.keywords)}")
-    if brief.date_range:
-        parts.append(f"Target Date: {brief.date_range}")
-    if brief.notes:
-        parts.append(f"Additional Notes: {brief.notes}")
-
-    parts.append("\n--- INSTRUCTIONS ---")
-    parts.append(
-        "Research and recommend up to 8 venues that match this brief. "
-        "For each venue, use the web search tool to find and verify: "
-        "the venue's website, phone number, email, private event contact, "
-        "pricing details, capacity, and any relevant details.\n\n"
-        "After researching, return your results as a JSON object with this exact structure:\n"
-        "{\n"
-        '  "venues": [\n'
-        "    {\n"
-        '      "name": "Venue Name",\n'
-        '      "address": "Full street address",\n'
-        '      "neighborhood": "Neighborhood name",\n'
-        '      "city": "City",\n'
-        '      "venue_type": "e.g. restaurant - private dining",\n'
-        '      "website": "https://...",\n'
-        '      "phone": "phone number",\n'
-        '      "email": "events@ or contact email",\n'
-        '      "contact_name": "Events manager name if found",\n'
-        '      "price_range": "e.g. $$$, $150-200pp",\n'
-        '      "estimated_cost": "e.g. $4,500 for 20 guests",\n'
-        '      "capacity_min": 10,\n'
-        '      "capacity_max": 40,\n'
-        '      "private_space": true,\n'
-        '      "av_available": false,\n'
-        '      "outdoor_space": true,\n'
-        '      "cuisine_or_style": "e.g. Modern American, Italian",\n'
-        '      "best_for": ["dinner", "happy_hour"],\n'
-        '      "highlights": "1-2 sentence pitch for why this venue fits the brief",\n'
-        '      "source_url": "URL where you found/verified info",\n'
-        '      "confidence": "high"\n'
-        "    }\n"
-        "  ],\n"
-        '  "research_notes": "Brief summary of your research process and any caveats"\n'
-        "}\n\n"
-        "Return ONLY the JSON object, no other text."
+
+def build_research_brief(brief: EventBrief) -> str:
+    """Build the per-brief section of the research prompt (follows the instructions)."""
+    # EventBrief's list fields make it unhashable, so the cache keys on its
+    # fields with the lists as tuples
+    return _build_research_brief(
+        brief.event_type, brief.city, brief.neighborhood, brief.budget, brief.guest_count,
+        brief.vibe, brief.audience, tuple(brief.requirements), tuple(brief.keywords),
+        brief.date_range, brief.notes,
     )
 
-    return "\n".join(parts)
+
+@functools.lru_cache(maxsize=256)
+def _build_research_brief(
+    event_type: EventType,
+    city: str,
+    neighborhood: str | None,
+    budget: str | None,
+    guest_count: int | None,
+    vibe: str | None,
+    audience: str | None,
+    requirements: tuple[str, ...],
+    keywords: tuple[str, ...],
+    date_range: str | None,
+    notes: str | None,
+) -> str:
+    values = (
+        neighborhood, budget, guest_count, vibe, audience,
+        ", ".join(requirements), ", ".join(keywords), date_range, notes,
+    )
+    return "\n".join([
+        "--- EVENT BRIEF ---",
+        f"Event Type: {event_type.value}",
+        f"City: {city}",
+        *(f"{label}: {value}" for label, value in zip(_BRIEF_LABELS, values) if value),
+    ])
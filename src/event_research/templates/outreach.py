@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+
+from event_research.models import EVENT_TYPE_BY_VALUE, EventType
+
 
 # ---- Contact Enrichment ----
 
@@ -13,6 +17,27 @@ and business directories to find the most direct contact for event inquiries.\
 """
 
 
+# What to look for and how to report it — identical for every venue
+_ENRICHMENT_INSTRUCTIONS = (
+    "\nSearch for:\n"
+    "1. The name and title of the person who handles private events, "
+    "catering, or group dining inquiries\n"
+    "2. A direct email address for event inquiries "
+    "(events@, privateevents@, catering@ — not generic info@)\n"
+    "3. A direct phone number or extension for events\n"
+    "4. The URL of their private events or private dining page\n"
+    "5. Any online booking or inquiry form URL\n\n"
+    "Search the venue's own website first, then check event planning sites "
+    "(The Venue Report, Peerspace, etc.), social media (LinkedIn for staff), "
+    "and business directories.\n\n"
+    "As soon as you've found a direct events contact you're confident in, "
+    "stop searching. Record your findings with the return_enrichment tool. "
+    "Only fill in fields where you found actual information; leave the "
+    "others null."
+)
+
+
+@functools.lru_cache(maxsize=256)
 def build_enrichment_prompt(
     venue_name: str,
     address: str,
@@ -21,43 +46,18 @@ def build_enrichment_prompt(
 ) -> str:
     """Build the user prompt for contact enrichment."""
 
-    prompt = (
-        f"Find the private events contact information for this venue:\n\n"
-        f"Name: {venue_name}\n"
-        f"Address: {address}\n"
-        f"City: {city}\n"
-    )
+    parts = [
+        "Find the private events contact information for this venue:",
+        "",
+        f"Name: {venue_name}",
+        f"Address: {address}",
+        f"City: {city}",
+    ]
     if website:
-        prompt += f"Website: {website}\n"
-
-    prompt += (
-        "\nSearch for:\n"
-        "1. The name and title of the person who handles private events, "
-        "catering, or group dining inquiries\n"
-        "2. A direct email address for event inquiries "
-        "(events@, privateevents@, catering@ — not generic info@)\n"
-        "3. A direct phone number or extension for events\n"
-        "4. The URL of their private events or private dining page\n"
-        "5. Any online booking or inquiry form URL\n\n"
-        "Search the venue's own website first, then check event planning sites "
-        "(The Venue Report, Peerspace, etc.), social media (LinkedIn for staff), "
-        "and business directories.\n\n"
-        "Return a JSON object:\n"
-        "{\n"
-        '  "contact_name": "Name of events coordinator or null",\n'
-        '  "contact_title": "Their title or null",\n'
-        '  "email": "events email or null",\n'
-        '  "phone": "phone number or null",\n'
-        '  "private_events_url": "URL to their private events page or null",\n'
-        '  "booking_form_url": "URL to inquiry/booking form or null",\n'
-        '  "enrichment_notes": "Brief summary of what you found and source quality",\n'
-        '  "confidence": "high/medium/low"\n'
-        "}\n\n"
-        "Only include fields where you found actual information. "
-        "Set others to null.\n"
-        "Return ONLY the JSON object."
-    )
-    return prompt
+        parts.append(f"Website: {website}")
+
+    parts.append(_ENRICHMENT_INSTRUCTIONS)
+    return "\n".join(parts)
 
 
 # ---- Email Drafting ----
@@ -87,65 +87,114 @@ def build_email_prompt(
                        budget, vibe, audience, requirements
         private_events_url: URL to venue's private events page
     """
-
-    prompt = "Draft a professional outreach email for a private event inquiry.\n\n"
-
-    # Venue info
-    prompt += "VENUE INFORMATION:\n"
-    prompt += f"- Venue: {venue_name}\n"
-    prompt += f"- Contact: {contact_name or 'Events Team'}\n"
+    # The shared event details + instructions lead, so every venue in a
+    # batch sends the same prompt prefix; only the venue lines differ
+    parts = [
+        _email_details_block(event_details),
+        "",
+        # Venue info
+        "VENUE INFORMATION:",
+        f"- Venue: {venue_name}",
+        f"- Contact: {contact_name or 'Events Team'}",
+    ]
     if highlights:
-        prompt += f"- Why selected: {highlights}\n"
+        parts.append(f"- Why selected: {highlights}")
     if private_events_url:
-        prompt += f"- Private events page: {private_events_url}\n"
-
-    # Event details
-    prompt += "\nEVENT DETAILS:\n"
-    prompt += f"- Type: {event_details.get('event_type', 'Private event')}\n"
-    prompt += f"- Date: {event_details.get('date', 'Flexible')}\n"
-    prompt += f"- Guest count: {event_details.get('guest_count', 'TBD')}\n"
-    prompt += f"- Budget: {event_details.get('budget', 'Flexible')}\n"
+        parts.append(f"- Private events page: {private_events_url}")
+    return "\n".join(parts)
+
+
+def _email_details_block(event_details: dict) -> str:
+    """Task, event details and instructions — everything in the email prompt that isn't per-venue.
+
+    A batch drafts every venue against one event_details dict, so this is
+    cached on a hashable snapshot of it; details with nested values just
+    skip the cache.
+    """
+    try:
+        frozen = tuple(
+            (k, tuple(v) if isinstance(v, list) else v) for k, v in event_details.items()
+        )
+        hash(frozen)
+    except TypeError:
+        return _build_email_details_block(event_details)
+    return _cached_email_details_block(frozen)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_email_details_block(event_details: tuple) -> str:
+    return _build_email_details_block(dict(event_details))
+
+
+def _build_email_details_block(event_details: dict) -> str:
+    parts = [
+        "Draft a professional outreach email for a private event inquiry.",
+        "",
+        # Event details
+        "EVENT DETAILS:",
+        f"- Type: {event_details.get('event_type', 'Private event')}",
+        f"- Date: {event_details.get('date', 'Flexible')}",
+        f"- Guest count: {event_details.get('guest_count', 'TBD')}",
+        f"- Budget: {event_details.get('budget', 'Flexible')}",
+    ]
     if event_details.get("vibe"):
-        prompt += f"- Vibe: {event_details['vibe']}\n"
+        parts.append(f"- Vibe: {event_details['vibe']}")
     if event_details.get("audience"):
-        prompt += f"- Audience: {event_details['audience']}\n"
+        parts.append(f"- Audience: {event_details['audience']}")
     if event_details.get("requirements"):
         reqs = event_details["requirements"]
-        if isinstance(reqs, list):
+        if isinstance(reqs, (list, tuple)):
             reqs = ", ".join(reqs)
-        prompt += f"- Requirements: {reqs}\n"
-
-    # Instructions
-    prompt += (
-        "\nINSTRUCTIONS:\n"
-        "- Address the contact by name if known, otherwise 'Hi there'\n"
-        "- Reference why this venue caught our attention (use the highlights)\n"
-        "- State the event type and key details naturally\n"
-        "- Ask about: availability for the date, private space options, "
-        "pricing/minimums"
-    )
+        parts.append(f"- Requirements: {reqs}")
 
     # Add type-specific asks
-    event_type = event_details.get("event_type", "").lower()
-    if "dinner" in event_type:
-        prompt += ", prix fixe or set menu options"
-    elif "workshop" in event_type:
-        prompt += ", AV setup, WiFi, and seating flexibility"
-    elif "happy" in event_type:
-        prompt += ", bar packages and standing room capacity"
-
-    prompt += (
-        "\n- Keep it under 200 words\n"
-        "- Be warm and professional, not templated\n"
-        "- Sign off with just a first name (the sender will fill in their own)\n\n"
-        "Return JSON:\n"
-        "{\n"
-        '  "subject": "Email subject line",\n'
-        '  "body": "Full email body"\n'
-        "}\n\n"
-        "Return ONLY the JSON object."
+    asks = (
+        "availability for the date, private space options, pricing/minimums"
+        + _type_ask_suffix(str(event_details.get("event_type") or ""))
     )
-    return prompt
+
+    # Instructions
+    parts += [
+        "",
+        "INSTRUCTIONS:",
+        "- Address the contact by name if known, otherwise 'Hi there'",
+        "- Reference why this venue caught our attention (use the highlights below)",
+        "- State the event type and key details naturally",
+        f"- Ask about: {asks}",
+        "- Keep it under 200 words",
+        "- Be warm and professional, not templated",
+        "- Sign off with just a first name (the sender will fill in their own)",
+        "",
+        "Return the subject line and full body with the return_email tool.",
+    ]
+    return "\n".join(parts)
+
+
+_TYPE_ASK_SUFFIX: dict[EventType, str] = {
+    EventType.DINNER: ", prix fixe or set menu options",
+    EventType.WORKSHOP: ", AV setup, WiFi, and seating flexibility",
+    EventType.HAPPY_HOUR: ", bar packages and standing room capacity",
+}
+# Free-text event types ("Team dinner", extracted from a project page) are
+# matched on these keywords, in this order
+_TYPE_KEYWORDS = (
+    ("dinner", EventType.DINNER),
+    ("workshop", EventType.WORKSHOP),
+    ("happy", EventType.HAPPY_HOUR),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _type_ask_suffix(event_type: str) -> str:
+    """Extra asks for the email's event type — exact EventType values skip the keyword scan."""
+    exact = EVENT_TYPE_BY_VALUE.get(event_type)
+    if exact is not None:
+        return _TYPE_ASK_SUFFIX[exact]
+    lowered = event_type.lower()
+    for keyword, matched in _TYPE_KEYWORDS:
+        if keyword in lowered:
+            return _TYPE_ASK_SUFFIX[matched]
+    return ""
 
 
 # ---- Event Details Extraction ----
@@ -171,3 +220,8 @@ Return ONLY the JSON object.
 
 PAGE CONTENT:
 """
+
+
+def build_extraction_prompt(page_content: str) -> str:
+    """Build the extraction prompt for a project page's (already truncated) content."""
+    return EVENT_DETAILS_EXTRACT_PROMPT + page_content